@@ -4,13 +4,58 @@
 """
 
 import os
+import re
 import json
-import glob
+import fnmatch
 from datetime import datetime
 
+from jinja2 import Environment, FileSystemLoader, ModuleLoader, select_autoescape
+from markupsafe import Markup, escape
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+TEMPLATE_DIR = os.path.join(SCRIPT_DIR, 'templates')
+# 预编译模板包（由 precompile.py 生成）
+COMPILED_TEMPLATES = os.path.join(SCRIPT_DIR, '_compiled_templates.zip')
+# 更新包文件名匹配规则（模块加载时编译一次）
+_ZIP_RE = re.compile(fnmatch.translate('WorkTools_*.zip'))
+
+def _compiled_templates_fresh():
+    """预编译模板包存在且比全部模板源文件都新时才可使用（模板修改后旧包不再生效）"""
+    try:
+        compiled_mtime = os.path.getmtime(COMPILED_TEMPLATES)
+    except OSError:
+        return False
+    for root, _, files in os.walk(TEMPLATE_DIR):
+        for name in files:
+            if os.path.getmtime(os.path.join(root, name)) > compiled_mtime:
+                return False
+    return True
+
+def create_environment(use_compiled=True):
+    """创建 Jinja2 模板环境，预编译模板包是最新的时直接加载，否则从源模板编译"""
+    if use_compiled and _compiled_templates_fresh():
+        loader = ModuleLoader(COMPILED_TEMPLATES)
+    else:
+        loader = FileSystemLoader(TEMPLATE_DIR)
+    return Environment(
+        loader=loader,
+        autoescape=select_autoescape(['html', 'j2']),
+        auto_reload=False
+    )
+
+def render_changelog(items):
+    """拼接更新日志列表项（一次 join，避免逐项模板渲染）"""
+    parts = []
+    append = parts.append
+    for item in items:
+        append('<li>')
+        append(escape(item))
+        append('</li>')
+    return Markup(''.join(parts))
+
 def generate_index():
     """生成HTML索引页面"""
-    
+
     # 读取版本信息
     version_file = 'version.json'
     if os.path.exists(version_file):
@@ -28,159 +73,22 @@ def generate_index():
             "changelog": [],
             "published_at": datetime.now().strftime("%Y-%m-%d")
         }
-    
+
     # 查找更新包
-    zip_files = glob.glob('WorkTools_*.zip')
-    download_link = ""
-    if zip_files:
-        zip_name = os.path.basename(zip_files[0])
-        download_link = f'<a href="updates/{zip_name}" class="btn">下载最新版本</a>'
-    
-    # 生成HTML
-    html = f'''<!DOCTYPE html>
-<html lang="zh-CN">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{version_info['app_name']} - 更新服务器</title>
-    <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, "Helvetica Neue", Arial, sans-serif;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
-            display: flex;
-            justify-content: center;
-            align-items: center;
-            padding: 20px;
-        }}
-        .container {{
-            background: white;
-            border-radius: 20px;
-            padding: 40px;
-            max-width: 600px;
-            width: 100%;
-            box-shadow: 0 20px 60px rgba(0,0,0,0.3);
-        }}
-        h1 {{
-            color: #333;
-            margin-bottom: 10px;
-            font-size: 2em;
-        }}
-        .version {{
-            color: #667eea;
-            font-size: 1.2em;
-            font-weight: bold;
-            margin-bottom: 20px;
-        }}
-        .info {{
-            color: #666;
-            margin-bottom: 30px;
-            line-height: 1.6;
-        }}
-        .changelog {{
-            background: #f8f9fa;
-            border-radius: 10px;
-            padding: 20px;
-            margin-bottom: 30px;
-        }}
-        .changelog h3 {{
-            color: #333;
-            margin-bottom: 15px;
-            font-size: 1.1em;
-        }}
-        .changelog ul {{
-            list-style: none;
-            padding-left: 0;
-        }}
-        .changelog li {{
-            padding: 8px 0;
-            padding-left: 25px;
-            position: relative;
-            color: #555;
-        }}
-        .changelog li:before {{
-            content: "✓";
-            position: absolute;
-            left: 0;
-            color: #28a745;
-            font-weight: bold;
-        }}
-        .btn {{
-            display: inline-block;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 15px 40px;
-            border-radius: 30px;
-            text-decoration: none;
-            font-weight: bold;
-            transition: transform 0.2s, box-shadow 0.2s;
-        }}
-        .btn:hover {{
-            transform: translateY(-2px);
-            box-shadow: 0 10px 20px rgba(102, 126, 234, 0.4);
-        }}
-        .footer {{
-            margin-top: 30px;
-            padding-top: 20px;
-            border-top: 1px solid #eee;
-            color: #999;
-            font-size: 0.9em;
-        }}
-        .api-info {{
-            background: #e3f2fd;
-            border-left: 4px solid #2196f3;
-            padding: 15px;
-            margin-top: 20px;
-            border-radius: 5px;
-        }}
-        .api-info code {{
-            background: rgba(0,0,0,0.1);
-            padding: 2px 6px;
-            border-radius: 3px;
-            font-family: monospace;
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <h1>🛠️ {version_info['app_name']}</h1>
-        <div class="version">最新版本: {version_info['version']}</div>
-        <div class="info">
-            发布日期: {version_info.get('published_at', '未知')}
-        </div>
-        
-        <div class="changelog">
-            <h3>📝 更新日志</h3>
-            <ul>
-                {''.join(f'<li>{item}</li>' for item in version_info.get('changelog', ['无更新说明']))}
-            </ul>
-        </div>
-        
-        <center>
-            {download_link if download_link else '<p style="color: #999;">暂无下载包</p>'}
-        </center>
-        
-        <div class="api-info">
-            <strong>📡 API 端点</strong><br>
-            版本检查: <code>updates/version.json</code>
-        </div>
-        
-        <div class="footer">
-            © 2024 {version_info['app_name']} - 自动更新服务器
-        </div>
-    </div>
-</body>
-</html>'''
-    
-    # 写入文件
-    with open('_site/index.html', 'w', encoding='utf-8') as f:
-        f.write(html)
-    
+    zip_files = [e.name for e in os.scandir('.') if e.is_file() and _ZIP_RE.match(e.name)]
+    zip_name = zip_files[0] if zip_files else ""
+
+    # 流式渲染模板并直接写入文件，不在内存中拼出完整 HTML
+    env = create_environment()
+    stream = env.get_template('index.html.j2').stream(
+        version_info=version_info,
+        changelog_html=render_changelog(version_info.get('changelog', ['无更新说明'])),
+        zip_name=zip_name
+    )
+    # 合并小片段后再写入，减少 write 调用次数
+    stream.enable_buffering(size=32)
+    stream.dump('_site/index.html', encoding='utf-8')
+
     print("[OK] Index page generated: _site/index.html")
 
 if __name__ == '__main__':
@@ -0,0 +1,16 @@
+# -*- coding: utf-8 -*-
+"""
+预编译首页模板
+将 templates 目录下的 Jinja2 模板编译为 Python 模块并打包，供 generate_index.py 直接加载
+"""
+
+from generate_index import COMPILED_TEMPLATES, create_environment
+
+def precompile():
+    """编译全部模板到 zip 包"""
+    env = create_environment(use_compiled=False)
+    env.compile_templates(COMPILED_TEMPLATES, zip='deflated')
+    print(f"[OK] Templates compiled: {COMPILED_TEMPLATES}")
+
+if __name__ == '__main__':
+    precompile()
@@ -9,25 +9,90 @@ import os
 import sys
 import shutil
 import json
+import subprocess
 
 # 版本信息 - 优先从环境变量读取，用于CI/CD
-import os
 VERSION = os.environ.get('VERSION', '1.0.0')
 APP_NAME = "WorkTools"
 
+# JSON 编解码：优先使用 orjson，不可用时回退到标准库 json
+try:
+    import orjson
+
+    def _json_loads(data):
+        return orjson.loads(data)
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+except ImportError:
+    def _json_loads(data):
+        return json.loads(data)
+
+    def _json_dumps(obj):
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+
+# PyInstaller --add-data 路径分隔符 (Windows使用; Linux/Mac使用:)
+SEP = ';' if sys.platform == 'win32' else ':'
+
+# 打包的数据文件 (源路径, 目标目录)
+DATA_PAIRS = [
+    ('worktools', 'worktools'),
+    ('version.json', '.'),
+]
+
+# 隐藏导入
+HIDDEN_IMPORTS = [
+    'PyQt5.sip',
+    'PyQt5.QtCore',
+    'PyQt5.QtGui',
+    'PyQt5.QtWidgets',
+    'PIL',
+    'PIL.Image',
+    'PIL.ImageDraw',
+    'PIL.ImageFont',
+    'pandas',
+    'pandas.core',
+    'pandas.io',
+    'numpy',
+    'numpy.core',
+    'numpy.core.multiarray',
+    'openpyxl',
+    'psutil',
+    'pyqtgraph',
+    'requests',
+]
+
+# 排除不需要的库（减少打包体积）
+EXCLUDED_MODULES = ['matplotlib', 'pytest', 'PyQt6', 'PyQt6-Qt6']
+
+def _fast_rmtree(path):
+    """删除目录树，优先使用系统原生命令，失败时回退到 shutil.rmtree"""
+    if sys.platform == 'win32':
+        cmd = ['cmd', '/c', 'rmdir', '/s', '/q', path]
+    else:
+        cmd = ['rm', '-rf', path]
+    try:
+        subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    except (OSError, subprocess.CalledProcessError):
+        pass
+    if os.path.exists(path):
+        shutil.rmtree(path)
+
 def clean_build():
     """清理构建目录"""
     dirs_to_remove = ['build', 'dist', '__pycache__']
-    for dir_name in dirs_to_remove:
-        if os.path.exists(dir_name):
-            print(f"[Clean] Removing {dir_name}...")
-            shutil.rmtree(dir_name)
-    
-    # 删除.spec文件
-    for file in os.listdir('.'):
-        if file.endswith('.spec'):
-            print(f"[Clean] Removing {file}...")
-            os.remove(file)
+    # 只扫描一次当前目录，避免逐个 os.path.exists
+    with os.scandir('.') as it:
+        entries = list(it)
+    
+    for entry in entries:
+        if entry.name in dirs_to_remove and entry.is_dir():
+            print(f"[Clean] Removing {entry.name}...")
+            _fast_rmtree(entry.name)
+        # 删除.spec文件
+        elif entry.name.endswith('.spec') and entry.is_file():
+            print(f"[Clean] Removing {entry.name}...")
+            os.remove(entry.path)
 
 def write_version_file():
     """写入版本信息文件"""
@@ -39,7 +104,7 @@ def write_version_file():
     }
     
     with open('version.json', 'w', encoding='utf-8') as f:
-        json.dump(version_info, f, indent=2)
+        f.write(_json_dumps(version_info))
     
     print(f"[Version] Written: {VERSION}")
 
@@ -60,34 +125,10 @@ def build():
         '--noconfirm',
         # 图标
         '--icon=worktools/resources/icons/app.ico' if os.path.exists('worktools/resources/icons/app.ico') else '',
-        # 添加数据文件 (Windows使用; Linux/Mac使用:)
-        '--add-data=worktools;worktools' if sys.platform == 'win32' else '--add-data=worktools:worktools',
-        '--add-data=version.json;.' if sys.platform == 'win32' else '--add-data=version.json:.',
-        # 隐藏导入
-        '--hidden-import=PyQt5.sip',
-        '--hidden-import=PyQt5.QtCore',
-        '--hidden-import=PyQt5.QtGui',
-        '--hidden-import=PyQt5.QtWidgets',
-        '--hidden-import=PIL',
-        '--hidden-import=PIL.Image',
-        '--hidden-import=PIL.ImageDraw',
-        '--hidden-import=PIL.ImageFont',
-        '--hidden-import=pandas',
-        '--hidden-import=pandas.core',
-        '--hidden-import=pandas.io',
-        '--hidden-import=numpy',
-        '--hidden-import=numpy.core',
-        '--hidden-import=numpy.core.multiarray',
-        '--hidden-import=openpyxl',
-        '--hidden-import=psutil',
-        '--hidden-import=pyqtgraph',
-        '--hidden-import=requests',
-        # 排除不需要的库（减少打包体积）
-        '--exclude-module=matplotlib',
-        '--exclude-module=pytest',
-        '--exclude-module=PyQt6',
-        '--exclude-module=PyQt6-Qt6',
     ]
+    args += [f'--add-data={src}{SEP}{dst}' for src, dst in DATA_PAIRS]
+    args += [f'--hidden-import={module}' for module in HIDDEN_IMPORTS]
+    args += [f'--exclude-module={module}' for module in EXCLUDED_MODULES]
     
     # 过滤空参数
     args = [arg for arg in args if arg]
@@ -108,25 +149,25 @@ def create_update_package():
     # 创建更新目录
     update_dir = 'update_package'
     if os.path.exists(update_dir):
-        shutil.rmtree(update_dir)
+        _fast_rmtree(update_dir)
     os.makedirs(update_dir)
     
     # 复制主程序
     exe_path = f'dist/{APP_NAME}.exe'
     if os.path.exists(exe_path):
-        shutil.copy2(exe_path, update_dir)
+        shutil.copyfile(exe_path, os.path.join(update_dir, os.path.basename(exe_path)))
     
     # 复制版本文件
-    shutil.copy2('version.json', update_dir)
+    shutil.copyfile('version.json', os.path.join(update_dir, 'version.json'))
     
     # 创建ZIP包
     zip_name = f'{APP_NAME}_v{VERSION}.zip'
-    with zipfile.ZipFile(zip_name, 'w', zipfile.ZIP_DEFLATED) as zf:
-        for root, dirs, files in os.walk(update_dir):
-            for file in files:
-                file_path = os.path.join(root, file)
-                arcname = os.path.relpath(file_path, update_dir)
-                zf.write(file_path, arcname)
+    # exe 本身已压缩，使用最低压缩级别节省打包时间
+    with zipfile.ZipFile(zip_name, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as zf:
+        # 更新目录只有一层（exe + version.json），直接列出即可
+        for name in os.listdir(update_dir):
+            # ZipFile.write 按块流式读取源文件，不会将整个 exe 读入内存
+            zf.write(os.path.join(update_dir, name), name)
     
     print(f"[Package] Created: {zip_name}")
     
@@ -145,12 +186,12 @@ def create_update_package():
     }
     
     with open('server_version.json', 'w', encoding='utf-8') as f:
-        json.dump(server_version, f, indent=2, ensure_ascii=False)
+        f.write(_json_dumps(server_version))
     
     print("[Package] Server version file created: server_version.json")
     
     # 清理临时目录
-    shutil.rmtree(update_dir)
+    _fast_rmtree(update_dir)
 
 if __name__ == '__main__':
     import argparse
@@ -9,25 +9,128 @@ import os
 import sys
 import shutil
 import json
+import subprocess
 
 # 版本信息 - 优先从环境变量读取，用于CI/CD
-import os
 VERSION = os.environ.get('VERSION', '1.0.0')
 APP_NAME = "WorkTools"
+SPEC_FILE = f"{APP_NAME}.spec"
+
+# JSON 编解码：优先使用 orjson，不可用时回退到标准库 json
+try:
+    import orjson
+
+    def _json_loads(data):
+        return orjson.loads(data)
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+except ImportError:
+    def _json_loads(data):
+        return json.loads(data)
+
+    def _json_dumps(obj):
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+
+# PyInstaller --add-data 路径分隔符 (Windows使用; Linux/Mac使用:)
+SEP = ';' if sys.platform == 'win32' else ':'
+
+# 打包的数据文件 (源路径, 目标目录)
+# 排除 plugins 目录的具体插件文件，只保留 plugin_manager_tool 和 base_plugin
+# 这样插件可以按需下载和安装
+DATA_PAIRS = [
+    ('worktools/base_plugin.py', 'worktools'),
+    ('worktools/plugin_manager.py', 'worktools'),
+    ('worktools/plugins/__init__.py', 'worktools/plugins'),
+    ('worktools/plugins/plugin_manager_tool.py', 'worktools/plugins'),
+    ('worktools/plugins/local_plugins.json', 'worktools/plugins'),
+    ('worktools/api_settings_dialog.py', 'worktools'),
+    ('worktools/updater.py', 'worktools'),
+    ('version.json', '.'),
+    ('worktools/navigation.py', 'worktools'),
+    ('worktools/workspace.py', 'worktools'),
+    ('worktools/main_window.py', 'worktools'),
+    ('worktools/app.py', 'worktools'),
+    ('worktools/icon_cache.py', 'worktools'),
+    # 添加resources目录
+    ('worktools/resources', 'worktools/resources'),
+]
+
+# 隐藏导入
+HIDDEN_IMPORTS = [
+    'PyQt5.sip',
+    'PyQt5.QtCore',
+    'PyQt5.QtGui',
+    'PyQt5.QtWidgets',
+    'PIL',
+    'PIL.Image',
+    'PIL.ImageDraw',
+    'PIL.ImageFont',
+    'pandas',
+    'pandas.core',
+    'pandas.io',
+    'numpy',
+    'numpy.core',
+    'numpy.core.multiarray',
+    'openpyxl',
+    'psutil',
+    'pyqtgraph',
+    'requests',
+    # 插件相关导入（不包含具体插件，只包含框架）
+    'worktools.plugin_manager',
+    'worktools.plugins.plugin_manager_tool',
+    'worktools.base_plugin',
+]
+
+# 排除不需要的库（减少打包体积）
+EXCLUDED_MODULES = ['matplotlib', 'pytest', 'PyQt6', 'PyQt6-Qt6']
+
+# 可选：设置环境变量 CYTHON_BUILD=1 时用 Cython 编译插件框架模块（源码保持纯 Python）
+CYTHON_BUILD = os.environ.get('CYTHON_BUILD') == '1'
+CYTHON_MODULES = [
+    'worktools/plugin_manager.py',
+    'worktools/base_plugin.py',
+    'worktools/workspace.py',
+]
+
+def _fast_rmtree(path):
+    """删除目录树，优先使用系统原生命令，失败时回退到 shutil.rmtree"""
+    if sys.platform == 'win32':
+        cmd = ['cmd', '/c', 'rmdir', '/s', '/q', path]
+    else:
+        cmd = ['rm', '-rf', path]
+    try:
+        subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    except (OSError, subprocess.CalledProcessError):
+        pass
+    if os.path.exists(path):
+        shutil.rmtree(path)
 
 def clean_build():
     """清理构建目录"""
     dirs_to_remove = ['build', 'dist', '__pycache__']
-    for dir_name in dirs_to_remove:
-        if os.path.exists(dir_name):
-            print(f"[Clean] Removing {dir_name}...")
-            shutil.rmtree(dir_name)
+    # 只扫描一次当前目录，避免逐个 os.path.exists
+    with os.scandir('.') as it:
+        entries = list(it)
     
-    # 删除.spec文件
-    for file in os.listdir('.'):
-        if file.endswith('.spec'):
-            print(f"[Clean] Removing {file}...")
-            os.remove(file)
+    for entry in entries:
+        if entry.name in dirs_to_remove and entry.is_dir():
+            print(f"[Clean] Removing {entry.name}...")
+            _fast_rmtree(entry.name)
+        # 删除.spec文件
+        elif entry.name.endswith('.spec') and entry.is_file():
+            print(f"[Clean] Removing {entry.name}...")
+            os.remove(entry.path)
+
+    remove_extensions()
+
+def remove_extensions():
+    """删除 Cython 生成的 C 文件和扩展模块，否则会优先于 .py 源码被导入"""
+    with os.scandir('worktools') as it:
+        for entry in it:
+            if entry.name.endswith(('.c', '.pyd', '.so')) and entry.is_file():
+                print(f"[Clean] Removing worktools/{entry.name}...")
+                os.remove(entry.path)
 
 def write_version_file():
     """写入版本信息文件"""
@@ -35,93 +138,92 @@ def write_version_file():
     if os.path.exists('version.json'):
         try:
             with open('version.json', 'r', encoding='utf-8') as f:
-                version_info = json.load(f)
+                version_info = _json_loads(f.read())
         except:
             version_info = {}
     else:
         version_info = {}
 
     # 更新版本和 URL，保留其他字段（如 changelog）
-    version_info["version"] = VERSION
-    version_info["app_name"] = APP_NAME
-    version_info["update_url"] = "https://tools.kyeo.top/updates/version.json"
-    version_info["download_url"] = f"https://tools.kyeo.top/updates/WorkTools_v{VERSION}.zip"
+    updates = {
+        "version": VERSION,
+        "app_name": APP_NAME,
+        "update_url": "https://tools.kyeo.top/updates/version.json",
+        "download_url": f"https://tools.kyeo.top/updates/WorkTools_v{VERSION}.zip"
+    }
+
+    # 内容未变化时不重写文件，保留 mtime 以便下游缓存
+    if all(version_info.get(key) == value for key, value in updates.items()):
+        print(f"[Version] Unchanged, skipping: {VERSION}")
+        return
+
+    version_info.update(updates)
 
     with open('version.json', 'w', encoding='utf-8') as f:
-        json.dump(version_info, f, indent=2, ensure_ascii=False)
+        f.write(_json_dumps(version_info))
 
     print(f"[Version] Written: {VERSION}")
 
-def build():
-    """执行打包"""
-    print("[Build] Starting build...")
-    
-    # 确保版本文件存在
-    write_version_file()
+def compile_resources():
+    """将 Qt 资源（样式表等）编译为 worktools/resources_rc.py"""
+    print("[Build] Compiling Qt resources...")
+    subprocess.run([sys.executable, '-m', 'PyQt5.pyrcc_main',
+                    'worktools/resources/resources.qrc',
+                    '-o', 'worktools/resources_rc.py'], check=True)
+
+def compile_extensions():
+    """用 Cython 将插件框架模块就地编译为扩展模块（仅在 CYTHON_BUILD=1 时执行）"""
+    if not CYTHON_BUILD:
+        return
+    print("[Build] Compiling modules with Cython...")
+    # binding=True 让编译后的方法保留参数签名，PyQt 连接槽时仍能正确匹配信号参数
+    subprocess.run([sys.executable, '-m', 'Cython.Build.Cythonize', '-i', '-3',
+                    '-X', 'binding=True'] + CYTHON_MODULES, check=True)
+
+def generate_spec():
+    """生成 PyInstaller spec 文件"""
+    print(f"[Build] Generating {SPEC_FILE}...")
     
-    # PyInstaller参数
+    # PyInstaller参数（spec 只描述打包内容，不包含 --clean/--noconfirm 等构建选项）
     args = [
         'main.py',
         '--name=%s' % APP_NAME,
         '--windowed',
         '--onefile',  # 打包成单个exe
-        '--clean',
-        '--noconfirm',
         # 图标
         '--icon=worktools/resources/icons/app.ico' if os.path.exists('worktools/resources/icons/app.ico') else '',
-        # 添加数据文件 (Windows使用; Linux/Mac使用:)
-        # 排除 plugins 目录的具体插件文件，只保留 plugin_manager_tool 和 base_plugin
-        # 这样插件可以按需下载和安装
-        '--add-data=worktools/base_plugin.py;worktools' if sys.platform == 'win32' else '--add-data=worktools/base_plugin.py:worktools',
-        '--add-data=worktools/plugin_manager.py;worktools' if sys.platform == 'win32' else '--add-data=worktools/plugin_manager.py:worktools',
-        '--add-data=worktools/plugins/__init__.py;worktools/plugins' if sys.platform == 'win32' else '--add-data=worktools/plugins/__init__.py:worktools/plugins',
-        '--add-data=worktools/plugins/plugin_manager_tool.py;worktools/plugins' if sys.platform == 'win32' else '--add-data=worktools/plugins/plugin_manager_tool.py:worktools/plugins',
-        '--add-data=worktools/plugins/local_plugins.json;worktools/plugins' if sys.platform == 'win32' else '--add-data=worktools/plugins/local_plugins.json:worktools/plugins',
-        '--add-data=worktools/api_settings_dialog.py;worktools' if sys.platform == 'win32' else '--add-data=worktools/api_settings_dialog.py:worktools',
-        '--add-data=worktools/updater.py;worktools' if sys.platform == 'win32' else '--add-data=worktools/updater.py:worktools',
-        '--add-data=version.json;.' if sys.platform == 'win32' else '--add-data=version.json:.',
-        '--add-data=worktools/navigation.py;worktools' if sys.platform == 'win32' else '--add-data=worktools/navigation.py:worktools',
-        '--add-data=worktools/workspace.py;worktools' if sys.platform == 'win32' else '--add-data=worktools/workspace.py:worktools',
-        '--add-data=worktools/main_window.py;worktools' if sys.platform == 'win32' else '--add-data=worktools/main_window.py:worktools',
-        '--add-data=worktools/app.py;worktools' if sys.platform == 'win32' else '--add-data=worktools/app.py:worktools',
-        # 添加resources目录
-        '--add-data=worktools/resources;worktools/resources' if sys.platform == 'win32' else '--add-data=worktools/resources:worktools/resources',
-        # 隐藏导入
-        '--hidden-import=PyQt5.sip',
-        '--hidden-import=PyQt5.QtCore',
-        '--hidden-import=PyQt5.QtGui',
-        '--hidden-import=PyQt5.QtWidgets',
-        '--hidden-import=PIL',
-        '--hidden-import=PIL.Image',
-        '--hidden-import=PIL.ImageDraw',
-        '--hidden-import=PIL.ImageFont',
-        '--hidden-import=pandas',
-        '--hidden-import=pandas.core',
-        '--hidden-import=pandas.io',
-        '--hidden-import=numpy',
-        '--hidden-import=numpy.core',
-        '--hidden-import=numpy.core.multiarray',
-        '--hidden-import=openpyxl',
-        '--hidden-import=psutil',
-        '--hidden-import=pyqtgraph',
-        '--hidden-import=requests',
-        # 插件相关导入（不包含具体插件，只包含框架）
-        '--hidden-import=worktools.plugin_manager',
-        '--hidden-import=worktools.plugins.plugin_manager_tool',
-        '--hidden-import=worktools.base_plugin',
-        # 排除不需要的库（减少打包体积）
-        '--exclude-module=matplotlib',
-        '--exclude-module=pytest',
-        '--exclude-module=PyQt6',
-        '--exclude-module=PyQt6-Qt6',
     ]
+    args += [f'--add-data={src}{SEP}{dst}' for src, dst in DATA_PAIRS]
+    args += [f'--hidden-import={module}' for module in HIDDEN_IMPORTS]
+    args += [f'--exclude-module={module}' for module in EXCLUDED_MODULES]
     
     # 过滤空参数
     args = [arg for arg in args if arg]
     
-    # 执行打包
+    subprocess.run([sys.executable, '-m', 'PyInstaller.utils.cliutils.makespec'] + args, check=True)
+
+def run_build():
+    """根据 spec 文件执行打包，复用 build/ 中已有的模块分析结果"""
     import PyInstaller.__main__
-    PyInstaller.__main__.run(args)
+    PyInstaller.__main__.run([SPEC_FILE, '--noconfirm'])
+
+def build():
+    """执行打包"""
+    print("[Build] Starting build...")
+    
+    # 确保版本文件存在
+    write_version_file()
+    
+    compile_resources()
+    # 扩展模块只在本次打包期间存在：先清除上次遗留的，打包结束（无论成功与否）后再删除，
+    # 之后的普通打包和 python main.py 都导入 .py 源码
+    remove_extensions()
+    try:
+        compile_extensions()
+        generate_spec()
+        run_build()
+    finally:
+        remove_extensions()
     
     print("[Build] Build completed!")
     print(f"[Build] Output: dist/{APP_NAME}.exe")
@@ -135,30 +237,30 @@ def create_update_package():
     # 创建更新目录
     update_dir = 'update_package'
     if os.path.exists(update_dir):
-        shutil.rmtree(update_dir)
+        _fast_rmtree(update_dir)
     os.makedirs(update_dir)
 
     # 复制主程序
     exe_path = f'dist/{APP_NAME}.exe'
     if os.path.exists(exe_path):
-        shutil.copy2(exe_path, update_dir)
+        shutil.copyfile(exe_path, os.path.join(update_dir, os.path.basename(exe_path)))
 
     # 复制版本文件
-    shutil.copy2('version.json', update_dir)
+    shutil.copyfile('version.json', os.path.join(update_dir, 'version.json'))
 
     # 创建ZIP包
     zip_name = f'{APP_NAME}_v{VERSION}.zip'
-    with zipfile.ZipFile(zip_name, 'w', zipfile.ZIP_DEFLATED) as zf:
-        for root, dirs, files in os.walk(update_dir):
-            for file in files:
-                file_path = os.path.join(root, file)
-                arcname = os.path.relpath(file_path, update_dir)
-                zf.write(file_path, arcname)
+    # exe 本身已压缩，使用最低压缩级别节省打包时间
+    with zipfile.ZipFile(zip_name, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as zf:
+        # 更新目录只有一层（exe + version.json），直接列出即可
+        for name in os.listdir(update_dir):
+            # ZipFile.write 按块流式读取源文件，不会将整个 exe 读入内存
+            zf.write(os.path.join(update_dir, name), name)
 
     print(f"[Package] Created: {zip_name}")
 
     # 清理临时目录
-    shutil.rmtree(update_dir)
+    _fast_rmtree(update_dir)
 
 if __name__ == '__main__':
     import argparse
@@ -172,7 +274,7 @@ if __name__ == '__main__':
     if args.command == 'clean':
         clean_build()
     elif args.command == 'build':
-        clean_build()
+        # 不清理 build/，以便 PyInstaller 复用上次的分析结果；需要全量重建时先执行 clean
         build()
     elif args.command == 'update':
         create_update_package()
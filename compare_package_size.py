@@ -4,13 +4,89 @@
 """
 
 import os
+import sys
+import tarfile
 import zipfile
 import tempfile
 import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
-def create_minimal_app():
-    """创建精简版应用目录"""
-    temp_dir = tempfile.mkdtemp()
+# 项目根目录，模块导入时计算一次
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# 可选：python compare_package_size.py --minify 时先压缩源码（去掉文档字符串、注释等）再打包
+try:
+    import python_minifier
+except ImportError:
+    python_minifier = None
+MINIFY_SOURCES = '--minify' in sys.argv
+
+# 可选：安装 zstandard 后额外生成 .tar.zst 包用于体积对比
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Linux 下的写时复制克隆 ioctl（Btrfs/XFS 等支持 reflink 的文件系统）
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+FICLONE = 0x40049409
+
+# 首次克隆失败后不再尝试，避免每个文件多一次无效的 open/ioctl
+_reflink_supported = fcntl is not None and sys.platform.startswith('linux')
+
+def _copy_file(src, dst):
+    """复制文件内容（不复制元数据，结果只用于打包对比），优先使用 reflink 克隆"""
+    global _reflink_supported
+    if MINIFY_SOURCES and python_minifier is not None and src.endswith('.py'):
+        with open(src, 'r', encoding='utf-8') as f:
+            code = python_minifier.minify(f.read(), remove_literal_statements=True)
+        with open(dst, 'w', encoding='utf-8') as f:
+            f.write(code)
+        return
+    if _reflink_supported:
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+            return
+        except OSError:
+            _reflink_supported = False
+    shutil.copyfile(src, dst)
+
+def _copy_files(copy_jobs):
+    """并行复制文件，copy_jobs 为 (源路径, 目标路径, 显示名称) 列表"""
+    # 小文件复制主要耗时在系统调用上，线程可在 I/O 期间释放 GIL 相互重叠
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(lambda job: _copy_file(job[0], job[1]), copy_jobs))
+    
+    for _, _, label in copy_jobs:
+        print(f"[OK] 复制: {label}")
+
+def _collect_py_files(src_dir, dest_dir, copy_jobs, rel_dir=""):
+    """递归收集目录中需要复制的 .py 文件，并预先创建目标目录"""
+    # 目标目录在遇到第一个 .py 文件时才创建，每个目录只调用一次 makedirs
+    dest_created = False
+    with os.scandir(src_dir) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                # 排除备份目录和测试文件
+                if 'builtin_backup' in entry.name or 'local_plugins.json' in entry.name:
+                    continue
+                _collect_py_files(entry.path, f"{dest_dir}{os.sep}{entry.name}",
+                                  copy_jobs, f"{rel_dir}{entry.name}/")
+            elif entry.name.endswith('.py'):
+                if not dest_created:
+                    os.makedirs(dest_dir, exist_ok=True)
+                    dest_created = True
+                copy_jobs.append((entry.path, f"{dest_dir}{os.sep}{entry.name}",
+                                  f"worktools/{rel_dir}{entry.name}"))
+
+def create_minimal_app(temp_dir):
+    """在临时目录下创建精简版应用目录"""
     app_dir = os.path.join(temp_dir, "WorkTools_Minimal")
     
     # 创建目录结构
@@ -19,61 +95,50 @@ def create_minimal_app():
     
     # 复制主程序文件
     files_to_copy = [
-        ("main.py", ""),
-        ("requirements.txt", ""),
-        ("version.json", ""),
-        ("worktools/__init__.py", "worktools/"),
-        ("worktools/app.py", "worktools/"),
-        ("worktools/main_window.py", "worktools/"),
-        ("worktools/navigation.py", "worktools/"),
-        ("worktools/workspace.py", "worktools/"),
-        ("worktools/plugin_manager.py", "worktools/"),
-        ("worktools/base_plugin.py", "worktools/"),
-        ("worktools/updater.py", "worktools/"),
-        ("worktools/plugins/__init__.py", "worktools/plugins/"),
-        ("worktools/plugins/plugin_manager_tool.py", "worktools/plugins/"),
-        ("worktools/resources/icons/app.png", "worktools/resources/icons/"),
+        "main.py",
+        "requirements.txt",
+        "version.json",
+        "worktools/__init__.py",
+        "worktools/__main__.py",
+        "worktools/app.py",
+        "worktools/icon_cache.py",
+        "worktools/main_window.py",
+        "worktools/navigation.py",
+        "worktools/workspace.py",
+        "worktools/plugin_manager.py",
+        "worktools/base_plugin.py",
+        "worktools/updater.py",
+        "worktools/plugins/__init__.py",
+        "worktools/plugins/plugin_manager_tool.py",
+        "worktools/resources/icons/app.png",
+        "worktools/resources/style.qss",
     ]
     
-    base_dir = os.path.dirname(os.path.abspath(__file__))
-    
-    for src_file, dest_dir in files_to_copy:
-        src_path = os.path.join(base_dir, src_file)
-        dest_path = os.path.join(app_dir, dest_dir, os.path.basename(src_file))
+    # 源/目标根目录只拼接一次，相对路径使用 / 分隔，Windows 下同样可用
+    copy_jobs = []
+    for src_file in files_to_copy:
+        src_path = f"{BASE_DIR}/{src_file}"
         
         if os.path.exists(src_path):
-            shutil.copy2(src_path, dest_path)
-            print(f"[OK] 复制: {src_file}")
+            copy_jobs.append((src_path, f"{app_dir}/{src_file}", src_file))
         else:
             print(f"[SKIP] 文件不存在: {src_file}")
     
+    _copy_files(copy_jobs)
+    
     return app_dir
 
-def create_full_app():
-    """创建完整版应用目录"""
-    temp_dir = tempfile.mkdtemp()
+def create_full_app(temp_dir):
+    """在临时目录下创建完整版应用目录"""
     app_dir = os.path.join(temp_dir, "WorkTools_Full")
     
     # 复制整个 worktools 目录
-    base_dir = os.path.dirname(os.path.abspath(__file__))
-    src_worktools = os.path.join(base_dir, "worktools")
+    src_worktools = os.path.join(BASE_DIR, "worktools")
     dest_worktools = os.path.join(app_dir, "worktools")
     
     # 只复制必要的文件
-    for root, dirs, files in os.walk(src_worktools):
-        # 排除备份目录和测试文件
-        if 'builtin_backup' in root or 'local_plugins.json' in root:
-            continue
-        
-        for file in files:
-            if file.endswith('.py'):
-                src_file = os.path.join(root, file)
-                rel_path = os.path.relpath(src_file, src_worktools)
-                dest_file = os.path.join(dest_worktools, rel_path)
-                
-                os.makedirs(os.path.dirname(dest_file), exist_ok=True)
-                shutil.copy2(src_file, dest_file)
-                print(f"[OK] 复制: worktools/{rel_path}")
+    copy_jobs = []
+    _collect_py_files(src_worktools, dest_worktools, copy_jobs)
     
     # 复制其他必要文件
     files_to_copy = [
@@ -83,56 +148,94 @@ def create_full_app():
     ]
     
     for file in files_to_copy:
-        src_path = os.path.join(base_dir, file)
-        dest_path = os.path.join(app_dir, file)
+        src_path = f"{BASE_DIR}/{file}"
         if os.path.exists(src_path):
-            shutil.copy2(src_path, dest_path)
-            print(f"[OK] 复制: {file}")
+            copy_jobs.append((src_path, f"{app_dir}/{file}", file))
+    
+    _copy_files(copy_jobs)
     
     return app_dir
 
 def calculate_directory_size(directory):
     """计算目录大小"""
     total_size = 0
-    for dirpath, dirnames, filenames in os.walk(directory):
-        for filename in filenames:
-            filepath = os.path.join(dirpath, filename)
-            total_size += os.path.getsize(filepath)
+    # 直接使用 DirEntry 的 stat 结果，避免 os.path.getsize 再次 stat
+    with os.scandir(directory) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                total_size += calculate_directory_size(entry.path)
+            else:
+                total_size += entry.stat(follow_symlinks=False).st_size
     return total_size
 
+# 小于该大小的文件整体读入后用 writestr 写入，省去 ZipFile.write 的逐块读取
+SMALL_FILE_LIMIT = 1 << 20
+
+def _zip_tree(zipf, directory, arc_dir):
+    """递归将目录写入 zip 包"""
+    with os.scandir(directory) as it:
+        for entry in it:
+            arcname = f"{arc_dir}/{entry.name}"
+            if entry.is_dir(follow_symlinks=False):
+                _zip_tree(zipf, entry.path, arcname)
+            elif entry.stat(follow_symlinks=False).st_size < SMALL_FILE_LIMIT:
+                with open(entry.path, 'rb') as f:
+                    zipf.writestr(arcname, f.read())
+            else:
+                zipf.write(entry.path, arcname)
+
 def create_zip_package(directory, zip_filename):
     """创建 zip 包"""
     zip_path = os.path.join(os.path.dirname(directory), zip_filename)
     
-    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-        for root, dirs, files in os.walk(directory):
-            for file in files:
-                file_path = os.path.join(root, file)
-                arcname = os.path.relpath(file_path, os.path.dirname(directory))
-                zipf.write(file_path, arcname)
+    # 仅用于体积对比，使用最快的压缩级别
+    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as zipf:
+        _zip_tree(zipf, directory, os.path.basename(directory))
     
     return zip_path
 
+def create_zstd_package(directory, tar_filename):
+    """创建 zstd 压缩的 tar 包（未安装 zstandard 时返回 None）"""
+    if zstandard is None:
+        return None
+    
+    tar_path = os.path.join(os.path.dirname(directory), tar_filename)
+    
+    # 多线程压缩，level 3 压缩率接近 DEFLATE-6 但速度更快
+    cctx = zstandard.ZstdCompressor(level=3, threads=-1)
+    with open(tar_path, 'wb') as f, cctx.stream_writer(f) as compressor, \
+            tarfile.open(fileobj=compressor, mode='w|') as tar:
+        tar.add(directory, arcname=os.path.basename(directory))
+    
+    return tar_path
+
 def main():
     print("=" * 70)
     print("打包体积对比工具")
     print("=" * 70)
     print()
     
-    # 创建临时目录
+    if MINIFY_SOURCES:
+        if python_minifier is None:
+            print("[SKIP] 未安装 python-minifier，按原始源码打包")
+        else:
+            print("[OK] 打包前压缩 .py 源码（两个版本均压缩）")
+        print()
+    
+    # 创建临时目录（精简版和完整版都建在其中，结束时一并清理）
     temp_dir = tempfile.mkdtemp()
     
     try:
         # 创建精简版
         print("创建精简版应用...")
         print("-" * 70)
-        minimal_dir = create_minimal_app()
+        minimal_dir = create_minimal_app(temp_dir)
         print()
         
         # 创建完整版
         print("创建完整版应用...")
         print("-" * 70)
-        full_dir = create_full_app()
+        full_dir = create_full_app(temp_dir)
         print()
         
         # 计算目录大小
@@ -148,6 +251,10 @@ def main():
         minimal_zip_size = os.path.getsize(minimal_zip)
         full_zip_size = os.path.getsize(full_zip)
         
+        # 创建 tar.zst 包（可选）
+        minimal_zst = create_zstd_package(minimal_dir, "WorkTools_Minimal.tar.zst")
+        full_zst = create_zstd_package(full_dir, "WorkTools_Full.tar.zst")
+        
         # 显示结果
         print()
         print("=" * 70)
@@ -164,13 +271,21 @@ def main():
         print(f"  完整版: {full_zip_size:,} bytes ({full_zip_size/1024:.2f} KB)")
         print(f"  减少: {full_zip_size - minimal_zip_size:,} bytes ({((full_zip_size - minimal_zip_size)/full_zip_size)*100:.1f}%)")
         print()
+        if minimal_zst and full_zst:
+            minimal_zst_size = os.path.getsize(minimal_zst)
+            full_zst_size = os.path.getsize(full_zst)
+            print("TAR.ZST 包大小对比:")
+            print(f"  精简版: {minimal_zst_size:,} bytes ({minimal_zst_size/1024:.2f} KB)")
+            print(f"  完整版: {full_zst_size:,} bytes ({full_zst_size/1024:.2f} KB)")
+            print(f"  减少: {full_zst_size - minimal_zst_size:,} bytes ({((full_zst_size - minimal_zst_size)/full_zst_size)*100:.1f}%)")
+            print()
         print(f"ZIP 包位置:")
         print(f"  精简版: {minimal_zip}")
         print(f"  完整版: {full_zip}")
         print()
         
         # 复制到项目目录方便查看
-        output_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "package_comparison")
+        output_dir = os.path.join(BASE_DIR, "package_comparison")
         if not os.path.exists(output_dir):
             os.makedirs(output_dir)
         
@@ -181,8 +296,9 @@ def main():
         print()
         
     finally:
-        # 清理临时目录
-        shutil.rmtree(temp_dir)
+        # 后台清理临时目录，与后续输出并行；非守护线程保证退出前删除完成
+        threading.Thread(target=shutil.rmtree, args=(temp_dir,),
+                         kwargs={'ignore_errors': True}).start()
     
     print("=" * 70)
     print("对比完成！")
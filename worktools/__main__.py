@@ -1,30 +1,21 @@
-#!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
 """
 PyQt工作工具主入口
+支持 python -m worktools 启动，根目录 main.py 也调用此处的 main()
 """
 
 import sys
 import os
 import logging
+import logging.handlers
 import tempfile
 from PyQt5.QtWidgets import QApplication
-from PyQt5.QtGui import QIcon
 
-def get_resource_path(relative_path):
-    """获取资源文件的绝对路径（支持开发和打包环境）"""
-    if hasattr(sys, '_MEIPASS'):
-        # PyInstaller打包后的临时目录
-        return os.path.join(sys._MEIPASS, relative_path)
-    # 开发环境
-    return os.path.join(os.path.dirname(os.path.abspath(__file__)), relative_path)
-
-# 添加应用路径到sys.path（仅开发环境）
-if not hasattr(sys, '_MEIPASS'):
-    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from .app import WorkToolsApp, APP_ICON_FILE
 
-from worktools.app import WorkToolsApp
+# 项目根目录（worktools 包的上级目录），模块导入时计算一次
+_HERE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
 def setup_logging():
     """设置日志配置"""
@@ -40,15 +31,24 @@ def setup_logging():
         log_file = os.path.join(log_dir, 'worktools.log')
     else:
         # 开发环境：写入项目目录
-        log_file = os.path.join(os.path.dirname(__file__), 'worktools.log')
+        log_file = os.path.join(_HERE, 'worktools.log')
+    
+    # 文件日志先缓存在内存中批量写入，遇到 ERROR 立即落盘；
+    # 退出时 logging.shutdown 会自动 flush 剩余记录
+    log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    file_handler = logging.FileHandler(log_file)
+    file_handler.setFormatter(logging.Formatter(log_format))
+    memory_handler = logging.handlers.MemoryHandler(
+        1000, flushLevel=logging.ERROR, target=file_handler)
     
     logging.basicConfig(
         level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        format=log_format,
         handlers=[
             logging.StreamHandler(),
-            logging.FileHandler(log_file)
-        ]
+            memory_handler
+        ],
+        force=True
     )
     return log_file
 
@@ -63,17 +63,15 @@ def main():
         # 创建并显示主窗口
         work_tools = WorkToolsApp(sys.argv)
     
-        # 设置应用信息
+        # 设置应用信息（版本号由 WorkToolsApp 从 version.json 读取）
         work_tools.setApplicationName("工作工具")
-        work_tools.setApplicationVersion("1.0.9")
         work_tools.setOrganizationName("WorkTools")
         
         # 设置应用图标
-        icon_path = get_resource_path("worktools/resources/icons/app.png")
-        if os.path.exists(icon_path):
-            work_tools.setWindowIcon(QIcon(icon_path))
+        if os.path.exists(APP_ICON_FILE):
+            work_tools.setWindowIcon(work_tools.app_icon)
         else:
-            logger.warning(f"图标文件不存在: {icon_path}")
+            logger.warning(f"图标文件不存在: {APP_ICON_FILE}")
         
         work_tools.show()
         
@@ -6,9 +6,9 @@ API设置对话框
 """
 
 from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, 
-                             QLineEdit, QPushButton, QGroupBox, QMessageBox,
-                             QTabWidget, QWidget)
-from PyQt5.QtCore import Qt, QSettings
+                             QLineEdit, QPushButton, QTabWidget, QWidget)
+
+from .base_plugin import get_shared_settings
 
 
 class APISettingsDialog(QDialog):
@@ -18,7 +18,7 @@ class APISettingsDialog(QDialog):
         super().__init__(parent)
         self.setWindowTitle("系统设置 - API配置")
         self.setMinimumSize(500, 350)
-        self.settings = QSettings("WorkTools", "PyQtWorkTools")
+        self.settings = get_shared_settings()
         
         self._setup_ui()
         self._load_settings()
@@ -121,16 +121,31 @@ class APISettingsDialog(QDialog):
         baidu_key = self.baidu_key_input.text().strip()
         gaode_key = self.gaode_key_input.text().strip()
         
-        self.settings.setValue("api/baidu_key", baidu_key)
-        self.settings.setValue("api/gaode_key", gaode_key)
-        
+        # 同一分组内批量写入，只写有变化的值，最后统一 sync 一次
+        self.settings.beginGroup("api")
+        changed = False
+        for key, value in (("baidu_key", baidu_key), ("gaode_key", gaode_key)):
+            if self.settings.value(key, "") != value:
+                self.settings.setValue(key, value)
+                changed = True
+        self.settings.endGroup()
+        if changed:
+            self.settings.sync()
+        
+        from PyQt5.QtWidgets import QMessageBox
         QMessageBox.information(self, "保存成功", "API设置已保存")
         self.accept()
         
     @staticmethod
     def get_api_keys():
         """静态方法获取API Keys"""
-        settings = QSettings("WorkTools", "PyQtWorkTools")
+        from PyQt5.QtCore import QCoreApplication, QThread, QSettings
+        app = QCoreApplication.instance()
+        if app is not None and QThread.currentThread() is app.thread():
+            settings = get_shared_settings()
+        else:
+            # QSettings 实例不能跨线程共享，工作线程中单独创建
+            settings = QSettings("WorkTools", "PyQtWorkTools")
         return {
             'baidu': settings.value("api/baidu_key", ""),
             'gaode': settings.value("api/gaode_key", "")
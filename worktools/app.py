@@ -5,16 +5,64 @@
 负责应用程序的初始化和生命周期管理
 """
 
+import os
 import sys
+import signal
 import logging
+import faulthandler
 from PyQt5.QtWidgets import QApplication
-from PyQt5.QtCore import QTimer, QSettings
-from PyQt5.QtGui import QFont
+from PyQt5.QtCore import Qt, QTimer, QFile
+from PyQt5.QtGui import QFont, QIcon, QPalette, QColor
 
 from .main_window import MainWindow
+from .icon_cache import get_icon
+from .version import load_version
 
 logger = logging.getLogger(__name__)
 
+# 资源目录
+_RESOURCES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'resources')
+
+# 主窗口样式表文件
+_STYLE_FILE = os.path.join(_RESOURCES_DIR, 'style.qss')
+
+# 应用图标文件
+APP_ICON_FILE = os.path.join(_RESOURCES_DIR, 'icons', 'app.png')
+
+def _read_stylesheet():
+    """读取主窗口样式表：优先使用编译进 Qt 资源的版本，开发环境回退到 .qss 文件"""
+    try:
+        from . import resources_rc  # noqa: F401  导入即注册 :/styles 资源
+    except ImportError:
+        with open(_STYLE_FILE, 'r', encoding='utf-8') as f:
+            return f.read()
+
+    qss_file = QFile(':/styles/app.qss')
+    if not qss_file.open(QFile.ReadOnly | QFile.Text):
+        raise OSError(qss_file.errorString())
+    try:
+        return bytes(qss_file.readAll()).decode('utf-8')
+    finally:
+        qss_file.close()
+
+def _log_exception(exc_type, exc_value, exc_traceback):
+    """全局异常处理：未捕获的异常写入日志"""
+    if issubclass(exc_type, KeyboardInterrupt):
+        sys.__excepthook__(exc_type, exc_value, exc_traceback)
+        return
+        
+    logger.error(
+        "未捕获的异常",
+        exc_info=(exc_type, exc_value, exc_traceback)
+    )
+
+def _log_unraisable(unraisable):
+    """记录无法抛出的异常（如析构函数、Qt 回调中被吞掉的异常）"""
+    logger.error(
+        f"无法抛出的异常: {unraisable.err_msg or 'Exception ignored in'} {unraisable.object!r}",
+        exc_info=(unraisable.exc_type, unraisable.exc_value, unraisable.exc_traceback)
+    )
+
 class WorkToolsApp(QApplication):
     """
     工作工具应用类
@@ -33,27 +81,20 @@ class WorkToolsApp(QApplication):
         
         # 应用设置
         self.setApplicationName("PyQt工作工具")
-        # 从 version.json 读取版本号
-        try:
-            import os
-            import json
-            version_file = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'version.json')
-            if os.path.exists(version_file):
-                with open(version_file, 'r', encoding='utf-8') as f:
-                    version_info = json.load(f)
-                    app_version = version_info.get('version', '1.0.0')
-            else:
-                app_version = '1.0.0'
-        except:
-            app_version = '1.0.0'
-        self.setApplicationVersion(app_version)
         self.setOrganizationName("WorkTools")
         
-        # 设置应用程序样式
-        self._setup_style()
+        # 设置默认字体（在创建控件前设置，避免控件创建后再整体重新布局）
+        self.setFont(QFont("Microsoft YaHei", 9))
+        
+        # 窗口和输入控件的底色通过调色板设置，样式表只保留边框、内边距等规则
+        self._setup_palette()
+        
+        # 不为原生子控件的兄弟控件创建原生窗口；合并鼠标移动、缩放等高频事件
+        self.setAttribute(Qt.AA_DontCreateNativeWidgetSiblings)
+        self.setAttribute(Qt.AA_CompressHighFrequencyEvents, True)
         
-        # 创建主窗口
-        self.main_window = MainWindow()
+        # 创建主窗口（样式表在创建子控件前设置，每个控件只按最终样式 polish 一次）
+        self.main_window = MainWindow(style_sheet=self._load_style())
         
         # 启动时更新检查器引用
         self.startup_updater = None
@@ -61,131 +102,53 @@ class WorkToolsApp(QApplication):
         # 设置异常处理
         self._setup_exception_handling()
         
-        # 设置定时器，用于异步任务
-        self._setup_timers()
+        # 其余初始化推迟到事件循环启动后执行，让主窗口先完成首次绘制
+        QTimer.singleShot(0, self._post_show_init)
         
         logger.info("工作工具应用初始化完成")
         
-    def _setup_style(self):
-        """设置应用程序样式"""
-        # 设置默认字体
-        font = QFont("Microsoft YaHei", 9)
-        self.setFont(font)
-        
-        # 设置应用程序样式表
-        style = """
-        QMainWindow {
-            background-color: #f0f0f0;
-        }
-        
-        QMenuBar {
-            background-color: #e0e0e0;
-            border-bottom: 1px solid #cccccc;
-        }
-        
-        QMenuBar::item {
-            background-color: transparent;
-            padding: 4px 8px;
-        }
-        
-        QMenuBar::item:selected {
-            background-color: #d0d0d0;
-        }
-        
-        QMenu {
-            background-color: #ffffff;
-            border: 1px solid #cccccc;
-        }
-        
-        QMenu::item {
-            padding: 6px 20px;
-        }
-        
-        QMenu::item:selected {
-            background-color: #e0e0e0;
-        }
-        
-        QStatusBar {
-            background-color: #e0e0e0;
-            border-top: 1px solid #cccccc;
-        }
-        
-        QSplitter::handle {
-            background-color: #d0d0d0;
-        }
-        
-        QSplitter::handle:horizontal {
-            width: 2px;
-        }
-        
-        QSplitter::handle:vertical {
-            height: 2px;
-        }
-        
-        QTreeWidget {
-            background-color: #ffffff;
-            border: 1px solid #cccccc;
-            alternate-background-color: #f8f8f8;
-        }
-        
-        QTreeWidget::item {
-            height: 24px;
-            border-bottom: 1px solid #f0f0f0;
-        }
-        
-        QTreeWidget::item:selected {
-            background-color: #c0d0ff;
-        }
-        
-        QLineEdit {
-            background-color: #ffffff;
-            border: 1px solid #cccccc;
-            border-radius: 3px;
-            padding: 2px 5px;
-        }
-        
-        QLineEdit:focus {
-            border-color: #4a90e2;
-        }
-        
-        QPushButton {
-            background-color: #f0f0f0;
-            border: 1px solid #cccccc;
-            border-radius: 3px;
-            padding: 4px 12px;
-        }
-        
-        QPushButton:hover {
-            background-color: #e0e0e0;
-        }
-        
-        QPushButton:pressed {
-            background-color: #d0d0d0;
-        }
-        
-        QStackedWidget {
-            background-color: #ffffff;
-            border: 1px solid #cccccc;
-            border-radius: 3px;
-        }
-        """
+    def _post_show_init(self):
+        """主窗口显示后的延迟初始化：版本号和更新检查定时器"""
+        # 从 version.json 读取版本号
+        app_version = load_version().get('version', '1.0.0')
+        self.setApplicationVersion(app_version)
         
-        self.setStyleSheet(style)
+        # 设置定时器，用于异步任务
+        self._setup_timers()
+        
+    def _setup_palette(self):
+        """设置应用程序调色板"""
+        palette = self.palette()
+        palette.setColor(QPalette.Window, QColor("#f0f0f0"))
+        palette.setColor(QPalette.Base, QColor("#ffffff"))
+        palette.setColor(QPalette.AlternateBase, QColor("#f8f8f8"))
+        self.setPalette(palette)
+        
+    def _load_style(self) -> str:
+        """读取应用程序样式表，读取失败时返回空字符串"""
+        # 样式表只作用于主窗口（及其子控件/对话框），缩小 Qt 样式匹配范围
+        try:
+            return _read_stylesheet()
+        except OSError as e:
+            logger.warning(f"加载样式表失败: {e}")
+            return ""
+        
+    @property
+    def app_icon(self) -> QIcon:
+        """应用图标，只解码一次，主窗口和对话框共享同一实例"""
+        return get_icon(APP_ICON_FILE, 256)
         
     def _setup_exception_handling(self):
         """设置异常处理"""
-        def handle_exception(exc_type, exc_value, exc_traceback):
-            """全局异常处理"""
-            if issubclass(exc_type, KeyboardInterrupt):
-                sys.__excepthook__(exc_type, exc_value, exc_traceback)
-                return
-                
-            logger.error(
-                "未捕获的异常",
-                exc_info=(exc_type, exc_value, exc_traceback)
-            )
+        sys.excepthook = _log_exception
+        sys.unraisablehook = _log_unraisable
+        
+        # 段错误等致命错误由 faulthandler 在 C 层输出回溯（窗口模式打包后没有 stderr）
+        if sys.stderr is not None:
+            faulthandler.enable()
             
-        sys.excepthook = handle_exception
+        # 终端中按 Ctrl+C 直接退出（Qt 事件循环运行时 Python 信号处理函数得不到执行）
+        signal.signal(signal.SIGINT, signal.SIG_DFL)
         
     def _setup_timers(self):
         """设置定时器"""
@@ -8,8 +8,41 @@
 from abc import ABC, abstractmethod
 from PyQt5.QtWidgets import QWidget
 from PyQt5.QtGui import QIcon
-from PyQt5.QtCore import QObject
-from typing import Dict, Any, Optional
+from PyQt5.QtCore import QObject, QSettings
+from typing import Dict, Any, NamedTuple, Optional
+
+class PluginMeta(NamedTuple):
+    """
+    插件元数据
+    
+    导航和注册只需要这些轻量信息，无需创建插件控件即可获得
+    """
+    name: str
+    description: str = ""
+    category: str = "其他"
+    version: str = "1.0.0"
+    shortcut: Optional[str] = None
+
+# 按应用名共享的 QSettings 实例（构造时需要打开注册表/解析 INI，只创建一次）
+_SHARED_SETTINGS: Dict[str, QSettings] = {}
+
+def get_shared_settings(application: str = "PyQtWorkTools") -> QSettings:
+    """
+    获取共享的 QSettings 实例
+    
+    插件和对话框读写设置时应使用此函数，不要每次自行创建 QSettings；
+    QSettings 不能跨线程共享，工作线程中仍需单独创建
+    
+    Args:
+        application: 应用名（组织名固定为 WorkTools）
+        
+    Returns:
+        QSettings 实例
+    """
+    settings = _SHARED_SETTINGS.get(application)
+    if settings is None:
+        settings = _SHARED_SETTINGS[application] = QSettings("WorkTools", application)
+    return settings
 
 class BasePlugin(QWidget):
     """
@@ -53,11 +86,29 @@ class BasePlugin(QWidget):
         """
         返回插件图标
         
+        从文件加载的图标应通过 worktools.icon_cache.get_icon 获取，
+        导航面板重建时不会重复读取图标文件
+        
         Returns:
             插件图标
         """
         raise NotImplementedError
         
+    def get_meta(self) -> PluginMeta:
+        """
+        返回插件元数据
+        
+        Returns:
+            由各 get_xxx 方法组成的插件元数据
+        """
+        return PluginMeta(
+            name=self.get_name(),
+            description=self.get_description(),
+            category=self.get_category(),
+            version=self.get_version(),
+            shortcut=self.get_shortcut()
+        )
+        
     def initialize(self):
         """
         插件初始化
@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+
+"""
+图标缓存
+同一路径的图标只加载一次，导航面板、工作区和对话框共享同一 QIcon 实例
+"""
+
+import functools
+from PyQt5.QtCore import QSize
+from PyQt5.QtGui import QIcon
+
+
+@functools.lru_cache(maxsize=256)
+def get_icon(path: str, size: int = 0) -> QIcon:
+    """
+    获取图标，结果按 (路径, 尺寸) 缓存
+
+    Args:
+        path: 图标文件路径，也可以是 ":/..." 形式的 Qt 资源路径
+        size: 图标文件对应的尺寸，0 表示由 Qt 读取文件时确定
+
+    Returns:
+        图标实例
+    """
+    icon = QIcon()
+    icon.addFile(path, QSize(size, size) if size else QSize())
+    return icon
@@ -0,0 +1,19 @@
+# -*- coding: utf-8 -*-
+
+"""
+JSON 工具
+解析时优先使用 orjson（直接解析 bytes），不可用时回退到标准库 json
+"""
+
+import json
+
+try:
+    import orjson
+
+    def json_loads(data):
+        """解析 JSON 文本（str 或 bytes）"""
+        return orjson.loads(data)
+except ImportError:
+    def json_loads(data):
+        """解析 JSON 文本（str 或 bytes）"""
+        return json.loads(data)
@@ -7,19 +7,31 @@
 
 import os
 import logging
-from PyQt5.QtWidgets import (QMainWindow, QWidget, QHBoxLayout, QVBoxLayout,
-                           QSplitter, QMenuBar, QMenu, QAction, QStatusBar,
-                           QMessageBox)
-from PyQt5.QtCore import Qt, QTimer, pyqtSignal, QSettings
-from PyQt5.QtGui import QIcon, QKeySequence, QFont
+from typing import Dict, Optional, Tuple
+from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QSplitter,
+                           QAction, QStatusBar)
+from PyQt5.QtCore import Qt, QSignalBlocker, QMetaObject, Q_ARG, QTimer, pyqtSlot
 
-from .plugin_manager import PluginManager
+from .plugin_manager import PluginManager, get_user_plugins_dir
 from .navigation import NavigationPanel
 from .workspace import Workspace
-from .updater import AutoUpdater
 
 logger = logging.getLogger(__name__)
 
+# 开发目录插件路径（包含plugin_manager_tool.py等内置插件），模块导入时计算一次
+DEV_PLUGIN_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "plugins")
+
+# 状态栏消息
+STATUS_READY = "就绪"
+STATUS_CHECKING_UPDATE = "正在检查更新..."
+
+# 插件事件的状态栏消息模板，按 (插件名, 事件) 格式化后缓存复用
+STATUS_TEMPLATES = {
+    'loaded': "插件 {} 已加载",
+    'activated': "插件 {} 已激活",
+    'deactivated': "插件 {} 已停用",
+}
+
 class MainWindow(QMainWindow):
     """
     主窗口类
@@ -27,10 +39,19 @@ class MainWindow(QMainWindow):
     负责整体布局管理和功能模块间的协调
     """
     
-    def __init__(self):
-        """初始化主窗口"""
+    def __init__(self, style_sheet: str = ""):
+        """
+        初始化主窗口
+        
+        Args:
+            style_sheet: 主窗口样式表，在创建子控件前设置
+        """
         super().__init__()
         
+        # 先设置样式表，之后创建的子控件直接按该样式 polish
+        if style_sheet:
+            self.setStyleSheet(style_sheet)
+        
         # 窗口设置
         self.setWindowTitle("PyQt工作工具")
         self.setMinimumSize(1000, 700)
@@ -40,11 +61,11 @@ class MainWindow(QMainWindow):
         self.navigation_panel = NavigationPanel()
         self.workspace = Workspace()
         
-        # 设置
-        self.settings = QSettings("WorkTools", "PyQtWorkTools")
+        # 自动更新管理器（首次手动检查更新时才创建，避免启动时导入网络模块）
+        self.auto_updater = None
         
-        # 自动更新管理器
-        self.auto_updater = AutoUpdater(self)
+        # 最近一次激活的插件名，用于截断工作区信号引起的重复激活
+        self._last_active: Optional[str] = None
         
         # 设置UI
         self._setup_ui()
@@ -52,11 +73,21 @@ class MainWindow(QMainWindow):
         self._setup_status_bar()
         self._connect_signals()
         
-        # 加载插件
-        self._load_plugins()
+        # 加载插件（排队到事件循环执行，窗口先完成首次绘制，期间导航面板显示占位项）
+        self.navigation_panel.show_loading()
+        QTimer.singleShot(0, self._load_plugins)
         
     def _setup_ui(self):
         """设置用户界面"""
+        # 构建界面期间暂停重绘，完成后统一刷新一次
+        self.setUpdatesEnabled(False)
+        try:
+            self._build_ui()
+        finally:
+            self.setUpdatesEnabled(True)
+            
+    def _build_ui(self):
+        """创建中央控件和导航/工作区布局"""
         # 创建中央控件
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -86,6 +117,15 @@ class MainWindow(QMainWindow):
         """设置菜单栏"""
         menubar = self.menuBar()
         
+        # 插件菜单
+        plugin_menu = menubar.addMenu("插件(&P)")
+        
+        # 重新加载插件动作
+        reload_plugins_action = QAction("重新加载插件(&R)", self)
+        reload_plugins_action.setStatusTip("重新扫描插件目录并加载插件")
+        reload_plugins_action.triggered.connect(self._reload_plugins)
+        plugin_menu.addAction(reload_plugins_action)
+        
         # 帮助菜单
         help_menu = menubar.addMenu("帮助(&H)")
         
@@ -109,7 +149,48 @@ class MainWindow(QMainWindow):
         self.setStatusBar(self.status_bar)
         
         # 添加永久消息
-        self.status_bar.showMessage("就绪")
+        self.status_bar.showMessage(STATUS_READY)
+        
+        # 插件事件的状态消息合并显示：短时间内的多条消息只显示最后一条
+        self._status_pending: Optional[Tuple[str, int]] = None
+        self._status_flush = QTimer(self, singleShot=True, interval=50,
+                                    timeout=self._flush_status)
+        
+        # 插件事件消息缓存：(插件名, 事件) -> 消息
+        self._status_cache: Dict[Tuple[str, str], str] = {}
+        
+    def _post_status(self, message: str, timeout: int = 3000):
+        """
+        提交一条状态栏消息，由定时器合并后显示
+        
+        Args:
+            message: 消息内容
+            timeout: 显示时长（毫秒）
+        """
+        self._status_pending = (message, timeout)
+        if not self._status_flush.isActive():
+            self._status_flush.start()
+            
+    def _post_plugin_status(self, plugin_name: str, kind: str):
+        """
+        提交插件事件的状态栏消息（同一插件同一事件的消息只格式化一次）
+        
+        Args:
+            plugin_name: 插件名
+            kind: 事件类型，STATUS_TEMPLATES 的键
+        """
+        key = (plugin_name, kind)
+        message = self._status_cache.get(key)
+        if message is None:
+            message = self._status_cache[key] = STATUS_TEMPLATES[kind].format(plugin_name)
+        self._post_status(message)
+            
+    @pyqtSlot()
+    def _flush_status(self):
+        """显示最近提交的状态栏消息"""
+        if self._status_pending:
+            self.status_bar.showMessage(*self._status_pending)
+            self._status_pending = None
         
     def _connect_signals(self):
         """连接信号和槽"""
@@ -125,46 +206,58 @@ class MainWindow(QMainWindow):
         # 工作区信号
         self.workspace.plugin_changed.connect(self._on_workspace_plugin_changed)
         
+    @pyqtSlot()
     def _load_plugins(self):
         """加载插件"""
-        from .plugins.plugin_manager_tool import get_user_plugins_dir
-
-        # 获取用户插件目录
-        user_plugin_dir = get_user_plugins_dir()
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        dev_plugin_dir = os.path.join(current_dir, "plugins")
-
         # 清空现有插件
         self.plugin_manager.clear_plugins()
+        self.workspace.clear_plugins()
+
+        self._scan_plugins()
+        self._populate_workspace()
+
+    @pyqtSlot()
+    def _reload_plugins(self):
+        """重新加载插件（保留现有界面，只替换工作区中的插件实例）"""
+        self.plugin_manager.reload()
+        self.workspace.clear_plugins()
+
+        self._scan_plugins()
+        self._populate_workspace()
 
-        # 从两个目录加载插件
+    def _scan_plugins(self):
+        """扫描开发目录和用户目录中的插件"""
+        # 从两个目录加载插件（目录不存在时由插件管理器记录警告并跳过）
         # 1. 先从开发目录加载（包含plugin_manager_tool.py等内置插件）
-        if os.path.exists(dev_plugin_dir):
-            logger.info(f"从开发目录加载插件: {dev_plugin_dir}")
-            self.plugin_manager.load_plugins(dev_plugin_dir)
+        logger.info(f"从开发目录加载插件: {DEV_PLUGIN_DIR}")
+        self.plugin_manager.load_plugins(DEV_PLUGIN_DIR)
 
         # 2. 再从用户目录加载（用户下载的插件）
-        if os.path.exists(user_plugin_dir):
-            logger.info(f"从用户目录加载插件: {user_plugin_dir}")
-            self.plugin_manager.load_plugins(user_plugin_dir)
+        user_plugin_dir = get_user_plugins_dir()
+        logger.info(f"从用户目录加载插件: {user_plugin_dir}")
+        self.plugin_manager.load_plugins(user_plugin_dir)
 
-        # 清空工作区
-        self.workspace.clear_plugins()
+    def _populate_workspace(self):
+        """根据插件管理器的内容更新导航面板和工作区"""
+        self._last_active = None
 
-        # 更新导航面板
+        # 更新导航面板（未加载的插件只按清单显示名称）
         plugins = self.plugin_manager.get_all_plugins()
         plugin_categories = self.plugin_manager.get_plugin_categories()
-        self.navigation_panel.update_plugins(plugins, plugin_categories)
+        self.navigation_panel.update_plugins(plugins, plugin_categories,
+                                             self.plugin_manager.get_plugin_metas())
 
-        # 将插件添加到工作区
+        # 将已加载的插件添加到工作区，其余插件在首次激活时添加
         for plugin_name, plugin in plugins.items():
             self.workspace.add_plugin(plugin_name, plugin)
 
-        # 如果有默认插件，激活它
-        if plugins:
-            first_plugin_name = next(iter(plugins.keys()))
-            self.activate_plugin(first_plugin_name)
+        # 如果有默认插件，激活它（排队到事件循环执行，让构造函数先返回、窗口先显示）
+        plugin_names = self.plugin_manager.get_plugin_names()
+        if plugin_names:
+            QMetaObject.invokeMethod(self, "activate_plugin", Qt.QueuedConnection,
+                                     Q_ARG(str, plugin_names[0]))
             
+    @pyqtSlot(str)
     def _on_plugin_selected(self, plugin_name: str):
         """
         处理插件选择事件
@@ -174,6 +267,7 @@ class MainWindow(QMainWindow):
         """
         self.activate_plugin(plugin_name)
         
+    @pyqtSlot(str)
     def _on_plugin_loaded(self, plugin_name: str):
         """
         处理插件加载事件
@@ -181,8 +275,9 @@ class MainWindow(QMainWindow):
         Args:
             plugin_name: 插件名
         """
-        self.status_bar.showMessage(f"插件 {plugin_name} 已加载", 3000)
+        self._post_plugin_status(plugin_name, 'loaded')
         
+    @pyqtSlot(str)
     def _on_plugin_activated(self, plugin_name: str):
         """
         处理插件激活事件
@@ -190,8 +285,9 @@ class MainWindow(QMainWindow):
         Args:
             plugin_name: 插件名
         """
-        self.status_bar.showMessage(f"插件 {plugin_name} 已激活", 3000)
+        self._post_plugin_status(plugin_name, 'activated')
         
+    @pyqtSlot(str)
     def _on_plugin_deactivated(self, plugin_name: str):
         """
         处理插件停用事件
@@ -199,8 +295,9 @@ class MainWindow(QMainWindow):
         Args:
             plugin_name: 插件名
         """
-        self.status_bar.showMessage(f"插件 {plugin_name} 已停用", 3000)
+        self._post_plugin_status(plugin_name, 'deactivated')
         
+    @pyqtSlot(str, str)
     def _on_plugin_error(self, plugin_name: str, error_msg: str):
         """
         处理插件错误事件
@@ -209,8 +306,9 @@ class MainWindow(QMainWindow):
             plugin_name: 插件名
             error_msg: 错误信息
         """
-        self.status_bar.showMessage(f"插件 {plugin_name} 错误: {error_msg}", 5000)
+        self._post_status(f"插件 {plugin_name} 错误: {error_msg}", 5000)
         
+    @pyqtSlot(str)
     def _on_workspace_plugin_changed(self, plugin_name: str):
         """
         处理工作区插件变化事件
@@ -218,12 +316,17 @@ class MainWindow(QMainWindow):
         Args:
             plugin_name: 新的插件名
         """
-        # 更新导航面板的选中状态
-        self.navigation_panel.set_active_plugin(plugin_name)
-        
-        # 激活插件
+        # 更新导航面板的选中状态（屏蔽导航面板信号，避免再次触发激活）
+        with QSignalBlocker(self.navigation_panel):
+            self.navigation_panel.set_active_plugin(plugin_name)
+        
+        # 由 activate_plugin 引起的切换插件已激活，无需重复激活
+        if plugin_name == self._last_active:
+            return
+        self._last_active = plugin_name
         self.plugin_manager.activate_plugin(plugin_name)
         
+    @pyqtSlot(str, result=bool)
     def activate_plugin(self, plugin_name: str) -> bool:
         """
         激活指定插件
@@ -234,21 +337,40 @@ class MainWindow(QMainWindow):
         Returns:
             是否成功激活
         """
-        # 激活插件
-        if not self.plugin_manager.activate_plugin(plugin_name):
-            return False
-            
-        # 在工作区显示插件
-        if not self.workspace.show_plugin(plugin_name):
-            return False
+        # 已是当前插件，无需重复激活
+        if plugin_name == self._last_active:
+            return True
             
-        # 更新导航面板选中状态
-        self.navigation_panel.set_active_plugin(plugin_name)
+        # 切换工作区和导航选中状态期间暂停重绘，完成后统一刷新一次
+        central_widget = self.centralWidget()
+        central_widget.setUpdatesEnabled(False)
+        try:
+            # 激活插件（首次激活时由插件管理器加载）
+            plugin = self.plugin_manager.activate_plugin(plugin_name)
+            if plugin is None:
+                return False
+            self._last_active = plugin_name
+                
+            # 新加载的插件加入工作区
+            if self.workspace.get_plugin_widget(plugin_name) is None:
+                self.workspace.add_plugin(plugin_name, plugin)
+                
+            # 在工作区显示插件（直接传入插件实例，无需再次查找）
+            if not self.workspace.show_plugin(plugin_name, plugin):
+                self._last_active = None
+                return False
+                
+            # 更新导航面板选中状态
+            self.navigation_panel.set_active_plugin(plugin_name)
+        finally:
+            central_widget.setUpdatesEnabled(True)
         
         return True
         
+    @pyqtSlot()
     def _show_about(self):
         """显示关于对话框"""
+        from PyQt5.QtWidgets import QMessageBox
         QMessageBox.about(
             self,
             "关于",
@@ -265,9 +387,13 @@ class MainWindow(QMainWindow):
             "• 图片水印工具"
         )
 
+    @pyqtSlot()
     def _check_update(self):
         """检查更新"""
-        self.status_bar.showMessage("正在检查更新...", 3000)
+        self.status_bar.showMessage(STATUS_CHECKING_UPDATE, 3000)
+        if self.auto_updater is None:
+            from .updater import AutoUpdater
+            self.auto_updater = AutoUpdater(self)
         self.auto_updater.check_update(silent=False)
         
     def closeEvent(self, event):
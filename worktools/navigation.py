@@ -6,15 +6,34 @@
 """
 
 import logging
-from typing import Dict, List
+from typing import Dict, List, NamedTuple, Optional, Set
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTreeWidget, 
                            QTreeWidgetItem, QLineEdit, QPushButton, QLabel,
-                           QFrame, QScrollArea, QButtonGroup, QStackedLayout)
-from PyQt5.QtCore import Qt, QSize, pyqtSignal
+                           QFrame, QScrollArea, QButtonGroup, QStackedLayout,
+                           QAbstractItemView)
+from PyQt5.QtCore import Qt, QSize, QTimer, QSignalBlocker, pyqtSignal, pyqtSlot
 from PyQt5.QtGui import QIcon, QFont, QPalette, QColor
 
 logger = logging.getLogger(__name__)
 
+# 导航树行高（所有行等高，由 setUniformRowHeights 统一使用）
+ITEM_SIZE_HINT = QSize(0, 24)
+
+# 搜索过滤的延迟（毫秒），连续输入时只在停顿后过滤一次
+FILTER_DELAY_MS = 120
+
+# 选中插件项的背景色（模块加载时创建一次）
+SELECTED_COLOR = QColor(200, 220, 255)
+
+
+class _PluginEntry(NamedTuple):
+    """导航树中的插件项记录（插件名、小写插件名、分类、树项）"""
+    name: str
+    lower: str
+    category: str
+    item: QTreeWidgetItem
+
+
 class NavigationPanel(QWidget):
     """
     导航面板类
@@ -33,9 +52,18 @@ class NavigationPanel(QWidget):
             parent: 父控件
         """
         super().__init__(parent)
-        self._plugin_items: Dict[str, QTreeWidgetItem] = {}  # 插件名到树项的映射
-        self._plugin_categories: Dict[str, List[str]] = {}  # 插件分类
+        self._entries: Dict[str, _PluginEntry] = {}  # 插件名到插件项记录的映射
+        self._category_items: Dict[str, QTreeWidgetItem] = {}  # 分类名到分类树项的映射
         self._current_plugin: str = ""  # 当前选中的插件
+        self._selected_item: Optional[QTreeWidgetItem] = None  # 当前高亮的插件项
+        self._pending_filter: str = ""  # 等待应用的搜索文本
+        self._visible_plugins: Set[str] = set()  # 当前可见的插件
+        
+        # 搜索过滤定时器：输入停顿后才执行一次过滤
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(FILTER_DELAY_MS)
+        self._filter_timer.timeout.connect(self._apply_filter)
         
         self._setup_ui()
         self._connect_signals()
@@ -71,83 +99,76 @@ class NavigationPanel(QWidget):
         self.plugin_tree = QTreeWidget()
         self.plugin_tree.setHeaderHidden(True)
         self.plugin_tree.setIndentation(15)
+        # 行高通过 sizeHint 设置而非样式表，等高行可跳过逐行尺寸计算
+        self.plugin_tree.setUniformRowHeights(True)
+        self.plugin_tree.setSelectionMode(QAbstractItemView.SingleSelection)
         main_layout.addWidget(self.plugin_tree)
         
     def _connect_signals(self):
         """连接信号和槽"""
-        self.plugin_tree.itemClicked.connect(self._on_item_clicked)
+        self.plugin_tree.currentItemChanged.connect(self._on_current_item_changed)
         self.search_box.textChanged.connect(self._on_search_text_changed)
         
-    def _on_item_clicked(self, item: QTreeWidgetItem, column: int):
+    @pyqtSlot(QTreeWidgetItem, QTreeWidgetItem)
+    def _on_current_item_changed(self, current: Optional[QTreeWidgetItem],
+                                 previous: Optional[QTreeWidgetItem]):
         """
-        处理树项点击事件
+        处理当前项变化事件（鼠标点击和键盘切换统一由此处理）
         
         Args:
-            item: 被点击的树项
-            column: 列索引
-        """
-        # 检查是否为插件项（不是分类项）
-        item_data = item.data(0, Qt.UserRole)
-        if item_data and isinstance(item_data, str):
-            plugin_name = item_data
-            self._select_plugin(plugin_name)
+            current: 新的当前项
+            previous: 之前的当前项
+        """
+        # 分类项和占位项位于顶层，没有父项；插件项的文本即插件名
+        if current is None or current.parent() is None:
+            return
+        self._select_plugin(current.text(0))
             
+    @pyqtSlot(str)
     def _on_search_text_changed(self, text: str):
         """
-        处理搜索文本变化事件
+        处理搜索文本变化事件（记录文本并重新计时，过滤在输入停顿后执行）
         
         Args:
             text: 搜索文本
         """
-        search_text = text.lower().strip()
+        self._pending_filter = text
+        self._filter_timer.start()
         
-        # 如果搜索框为空，显示所有项
-        if not search_text:
-            self._show_all_items()
-            return
-            
-        # 隐藏所有分类和插件
-        self._hide_all_items()
-        
-        # 搜索匹配的插件
-        matching_plugins = []
-        for plugin_name, item in self._plugin_items.items():
-            if search_text in plugin_name.lower():
-                matching_plugins.append(plugin_name)
-                
-        # 显示匹配的插件及其父分类
-        for plugin_name in matching_plugins:
-            item = self._plugin_items[plugin_name]
-            item.setHidden(False)
+    @pyqtSlot()
+    def _apply_filter(self):
+        """按最近一次输入的搜索文本过滤插件（只切换可见性发生变化的项）"""
+        search_text = self._pending_filter.lower().strip()
+        
+        # 匹配的插件；搜索框为空时显示所有插件
+        if search_text:
+            new_visible = {entry.name for entry in self._entries.values()
+                           if search_text in entry.lower}
+        else:
+            new_visible = set(self._entries)
             
-            # 显示父分类
-            parent = item.parent()
-            while parent:
-                parent.setHidden(False)
-                parent.setExpanded(True)
-                parent = parent.parent()
-                
-    def _hide_all_items(self):
-        """隐藏所有项"""
-        root = self.plugin_tree.invisibleRootItem()
-        for i in range(root.childCount()):
-            category_item = root.child(i)
-            category_item.setHidden(True)
+        if new_visible == self._visible_plugins:
+            return
             
-            for j in range(category_item.childCount()):
-                plugin_item = category_item.child(j)
-                plugin_item.setHidden(True)
+        self.plugin_tree.setUpdatesEnabled(False)
+        try:
+            for plugin_name in self._visible_plugins - new_visible:
+                self._entries[plugin_name].item.setHidden(True)
+            for plugin_name in new_visible - self._visible_plugins:
+                self._entries[plugin_name].item.setHidden(False)
                 
-    def _show_all_items(self):
-        """显示所有项"""
-        root = self.plugin_tree.invisibleRootItem()
-        for i in range(root.childCount()):
-            category_item = root.child(i)
-            category_item.setHidden(False)
+            # 分类项：搜索时只显示包含匹配插件的分类并展开，清空搜索时全部显示
+            visible_categories = {self._entries[name].category for name in new_visible}
+            for category, category_item in self._category_items.items():
+                visible = not search_text or category in visible_categories
+                if category_item.isHidden() == visible:
+                    category_item.setHidden(not visible)
+                if visible and search_text:
+                    category_item.setExpanded(True)
+        finally:
+            self.plugin_tree.setUpdatesEnabled(True)
             
-            for j in range(category_item.childCount()):
-                plugin_item = category_item.child(j)
-                plugin_item.setHidden(False)
+        self._visible_plugins = new_visible
                 
     def _select_plugin(self, plugin_name: str):
         """
@@ -173,67 +194,116 @@ class NavigationPanel(QWidget):
         Args:
             plugin_name: 被选中的插件名
         """
-        # 清除所有插件项的选中状态
-        for item in self._plugin_items.values():
-            item.setData(0, Qt.BackgroundRole, QColor(240, 240, 240))
+        # 只清除上一个选中项的背景色，不遍历所有插件项
+        if self._selected_item is not None:
+            self._selected_item.setData(0, Qt.BackgroundRole, None)
+            self._selected_item = None
             
         # 设置新选中插件项的背景色
-        if plugin_name in self._plugin_items:
-            item = self._plugin_items[plugin_name]
-            item.setData(0, Qt.BackgroundRole, QColor(200, 220, 255))
+        entry = self._entries.get(plugin_name)
+        if entry is not None:
+            entry.item.setData(0, Qt.BackgroundRole, SELECTED_COLOR)
+            self._selected_item = entry.item
             
-    def update_plugins(self, plugins: Dict[str, object], plugin_categories: Dict[str, List[str]]):
+            # 同步树控件的当前项，之后点击其他插件才会触发当前项变化
+            if self.plugin_tree.currentItem() is not entry.item:
+                with QSignalBlocker(self.plugin_tree):
+                    self.plugin_tree.setCurrentItem(entry.item)
+            
+    def update_plugins(self, plugins: Dict[str, object], plugin_categories: Dict[str, List[str]],
+                       plugin_metas: Optional[Dict[str, object]] = None):
         """
         更新插件列表
         
         Args:
-            plugins: 插件名到插件实例的映射
-            plugin_categories: 插件分类
+            plugins: 已加载的插件名到插件实例的映射（用于获取图标）
+            plugin_categories: 插件分类（包括尚未加载的插件）
+            plugin_metas: 插件名到插件元数据的映射（用于显示描述提示）
         """
+        # 暂停重绘并屏蔽树控件信号，所有项构建完成后一次性加入
+        self.plugin_tree.setUpdatesEnabled(False)
+        try:
+            with QSignalBlocker(self.plugin_tree):
+                self._populate_tree(plugins, plugin_categories, plugin_metas)
+        finally:
+            self.plugin_tree.setUpdatesEnabled(True)
+                    
+        # 设置当前选中插件
+        if self._current_plugin and self._current_plugin in self._entries:
+            self._update_selection_state(self._current_plugin)
+        
+        # 新建的项全部可见，搜索框有内容时重新过滤
+        self._visible_plugins = set(self._entries)
+        if self._pending_filter.strip():
+            self._apply_filter()
+            
+    def _populate_tree(self, plugins: Dict[str, object], plugin_categories: Dict[str, List[str]],
+                       plugin_metas: Optional[Dict[str, object]]):
+        """重建导航树（分类项脱离树构建，最后一次性加入）"""
         # 清空现有内容
         self.plugin_tree.clear()
-        self._plugin_items.clear()
-        self._plugin_categories = plugin_categories.copy()
+        self._entries.clear()
+        self._category_items.clear()
+        self._selected_item = None
+        
+        # 分类项字体只创建一次
+        category_font = self.plugin_tree.font()
+        category_font.setBold(True)
         
         # 按分类添加插件
+        top_items = []
         for category, plugin_names in plugin_categories.items():
             # 创建分类项
-            category_item = QTreeWidgetItem(self.plugin_tree)
+            category_item = QTreeWidgetItem()
             category_item.setText(0, category)
-            category_item.setExpanded(True)
-            
-            # 设置分类项字体
-            font = category_item.font(0)
-            font.setBold(True)
-            category_item.setFont(0, font)
+            category_item.setSizeHint(0, ITEM_SIZE_HINT)
+            category_item.setFont(0, category_font)
+            top_items.append(category_item)
+            self._category_items[category] = category_item
             
             # 添加该分类下的所有插件
             for plugin_name in plugin_names:
-                if plugin_name in plugins:
-                    plugin = plugins[plugin_name]
-                    
-                    # 创建插件项
-                    plugin_item = QTreeWidgetItem(category_item)
-                    plugin_item.setText(0, plugin_name)
-                    
-                    # 设置插件图标
+                # 创建插件项
+                plugin_item = QTreeWidgetItem(category_item)
+                plugin_item.setText(0, plugin_name)
+                plugin_item.setSizeHint(0, ITEM_SIZE_HINT)
+                
+                # 描述提示直接取自元数据，无需加载插件
+                meta = plugin_metas.get(plugin_name) if plugin_metas else None
+                if meta is not None and meta.description:
+                    plugin_item.setToolTip(0, meta.description)
+                
+                # 设置插件图标（仅已加载的插件）
+                plugin = plugins.get(plugin_name)
+                if plugin is not None:
                     try:
                         icon = plugin.get_icon()
                         if icon:
                             plugin_item.setIcon(0, icon)
                     except Exception as e:
                         logger.warning(f"获取插件 {plugin_name} 图标失败: {str(e)}")
-                    
-                    # 存储插件名
-                    plugin_item.setData(0, Qt.UserRole, plugin_name)
-                    
-                    # 保存引用
-                    self._plugin_items[plugin_name] = plugin_item
-                    
-        # 设置当前选中插件
-        if self._current_plugin and self._current_plugin in self._plugin_items:
-            self._update_selection_state(self._current_plugin)
+                
+                # 保存记录（插件名的小写形式只在列表更新时计算一次，供搜索使用）
+                self._entries[plugin_name] = _PluginEntry(
+                    plugin_name, plugin_name.lower(), category, plugin_item)
+                
+        # 一次性加入树中，加入后才能展开
+        self.plugin_tree.addTopLevelItems(top_items)
+        for category_item in top_items:
+            category_item.setExpanded(True)
             
+    def show_loading(self):
+        """插件加载完成前显示占位项（不含插件名，点击无效），update_plugins 时被替换"""
+        self.plugin_tree.clear()
+        self._entries.clear()
+        self._category_items.clear()
+        self._selected_item = None
+        loading_item = QTreeWidgetItem(["正在加载插件…"])
+        loading_item.setSizeHint(0, ITEM_SIZE_HINT)
+        loading_item.setFlags(Qt.NoItemFlags)
+        self.plugin_tree.addTopLevelItem(loading_item)
+        
+    @pyqtSlot(str)
     def set_active_plugin(self, plugin_name: str):
         """
         设置当前激活的插件
@@ -7,21 +7,273 @@
 
 import os
 import sys
-import importlib
+import ast
+import json
+import zlib
+import importlib.util
 import inspect
 import logging
-from typing import Dict, List, Optional, Type
-from PyQt5.QtCore import QObject, pyqtSignal
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Dict, FrozenSet, List, Mapping, NamedTuple, Optional, Tuple, Type
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
 
-from .base_plugin import BasePlugin
+from . import __version__
+from .base_plugin import BasePlugin, PluginMeta
+from .version import load_version
 
 logger = logging.getLogger(__name__)
 
+
+def get_user_plugins_dir():
+    """获取用户插件目录"""
+    # Windows: %APPDATA%/WorkTools/plugins
+    # Mac: ~/Library/Application Support/WorkTools/plugins
+    # Linux: ~/.config/WorkTools/plugins
+    if sys.platform == 'win32':
+        base_dir = os.environ.get('APPDATA', os.path.expanduser('~'))
+    elif sys.platform == 'darwin':
+        base_dir = os.path.expanduser('~/Library/Application Support')
+    else:
+        base_dir = os.path.expanduser('~/.config')
+
+    plugins_dir = os.path.join(base_dir, 'WorkTools', 'plugins')
+
+    # 确保目录存在
+    os.makedirs(plugins_dir, exist_ok=True)
+
+    return plugins_dir
+
+
+@functools.lru_cache(maxsize=1)
+def get_discovery_cache_file():
+    """获取插件发现结果缓存文件路径（与用户插件目录同级），只在首次调用时计算并创建目录"""
+    return os.path.join(os.path.dirname(get_user_plugins_dir()), 'plugins_cache.json')
+
+
+def _cache_tag() -> str:
+    """缓存标识：解释器或程序版本（version.json 中的版本号）变化时整个缓存失效"""
+    return f"{sys.version}|{load_version().get('version', __version__)}"
+
+
+def _is_bundled_dir(directory: str) -> bool:
+    """判断目录是否位于打包程序的临时解压目录中（单文件打包时每次启动路径都不同）"""
+    bundle_dir = getattr(sys, '_MEIPASS', None)
+    if not bundle_dir:
+        return False
+    bundle_dir = os.path.abspath(bundle_dir)
+    try:
+        return os.path.commonpath([bundle_dir, directory]) == bundle_dir
+    except ValueError:
+        return False
+
+
+class _PluginSource(NamedTuple):
+    """插件来源：按需加载时使用的模块名、目录和类名（类名为 None 时查找模块中第一个插件类）"""
+    module: str
+    directory: str
+    class_name: Optional[str]
+
+
+def _plugin_module_key(module_name: str, plugin_directory: str) -> str:
+    """
+    插件模块在 sys.modules 中的名称
+
+    按插件目录加前缀，开发目录和用户目录中的同名插件互不覆盖，也不会与标准库等模块重名
+    """
+    directory = os.path.normcase(os.path.abspath(plugin_directory))
+    return f"worktools._plugins.d{zlib.crc32(directory.encode('utf-8')):08x}.{module_name}"
+
+
+def _is_self_attr(node, attr: str) -> bool:
+    """判断节点是否为 self.<attr>"""
+    return (isinstance(node, ast.Attribute) and node.attr == attr and
+            isinstance(node.value, ast.Name) and node.value.id == 'self')
+
+
+def _is_str(node) -> bool:
+    """判断节点是否为字符串字面量"""
+    return isinstance(node, ast.Constant) and isinstance(node.value, str)
+
+
+def _single_return(func: ast.FunctionDef):
+    """返回函数体中唯一 return 语句的值节点，函数不是单一 return 时返回 None"""
+    returns = [node for node in ast.walk(func) if isinstance(node, ast.Return)]
+    if len(returns) == 1:
+        return returns[0].value
+    return None
+
+
+def _read_sidecar_manifest(manifest_file: str) -> Optional[Tuple[PluginMeta, Optional[str]]]:
+    """
+    读取插件旁的 <模块名>.manifest.json 清单
+
+    清单必须包含 name，可选 description、category、version、shortcut 和插件类名 class
+
+    Args:
+        manifest_file: 清单文件路径
+
+    Returns:
+        (插件元数据, 插件类名)，清单无效时返回 None
+    """
+    try:
+        with open(manifest_file, 'rb') as f:
+            data = json.loads(f.read())
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(data, dict) or not data.get('name'):
+        return None
+    fields = {key: data[key] for key in PluginMeta._fields if key in data}
+    return PluginMeta(**fields), data.get('class')
+
+
+def _is_plugin_class(node) -> bool:
+    """判断 AST 节点是否为直接继承 BasePlugin 的类定义"""
+    return isinstance(node, ast.ClassDef) and any(
+        isinstance(base, ast.Name) and base.id == 'BasePlugin'
+        or isinstance(base, ast.Attribute) and base.attr == 'BasePlugin'
+        for base in node.bases)
+
+
+def _file_declares_plugin(plugin_file: str) -> Optional[str]:
+    """
+    静态检查文件中是否声明了插件类（不导入模块）
+
+    Args:
+        plugin_file: 插件文件路径
+
+    Returns:
+        第一个插件类的类名，未声明插件类或无法解析时返回 None
+    """
+    try:
+        with open(plugin_file, 'rb') as f:
+            tree = ast.parse(f.read(), plugin_file)
+    except (OSError, SyntaxError, ValueError) as e:
+        logger.warning(f"解析插件文件 {plugin_file} 失败: {str(e)}")
+        return None
+
+    for node in tree.body:
+        if _is_plugin_class(node):
+            return node.name
+    return None
+
+
+def _read_plugin_manifest(plugin_file: str) -> Optional[Tuple[PluginMeta, str]]:
+    """
+    静态解析插件源码，获取插件元数据（不导入模块）
+
+    要求插件名在 __init__ 中以字符串字面量赋给 self._name，分类由
+    get_category 直接返回字符串字面量（或使用默认分类）；描述、版本和
+    快捷键为字面量时一并读取
+
+    Args:
+        plugin_file: 插件文件路径
+
+    Returns:
+        (插件元数据, 插件类名)，无法静态确定时返回 None
+    """
+    try:
+        with open(plugin_file, 'r', encoding='utf-8') as f:
+            tree = ast.parse(f.read(), plugin_file)
+    except (OSError, SyntaxError, ValueError):
+        return None
+
+    for node in tree.body:
+        if not _is_plugin_class(node):
+            continue
+
+        fields = {}
+        for item in node.body:
+            if not isinstance(item, ast.FunctionDef):
+                continue
+            if item.name == '__init__':
+                for stmt in ast.walk(item):
+                    if (isinstance(stmt, ast.Assign) and len(stmt.targets) == 1 and
+                            _is_str(stmt.value)):
+                        if _is_self_attr(stmt.targets[0], '_name'):
+                            fields['name'] = stmt.value.value
+                        elif _is_self_attr(stmt.targets[0], '_description'):
+                            fields['description'] = stmt.value.value
+            elif item.name == 'get_name':
+                value = _single_return(item)
+                if _is_str(value):
+                    fields['name'] = value.value
+                elif not _is_self_attr(value, '_name'):
+                    return None
+            elif item.name == 'get_category':
+                value = _single_return(item)
+                if not _is_str(value):
+                    return None
+                fields['category'] = value.value
+            elif item.name in ('get_version', 'get_shortcut'):
+                value = _single_return(item)
+                if _is_str(value):
+                    fields[item.name[4:]] = value.value
+
+        if not fields.get('name'):
+            return None
+        return PluginMeta(**fields), node.name
+
+    return None
+
+
+def _discover_plugin(plugin_directory: str, module_name: str, names: FrozenSet[str]):
+    """
+    发现单个插件文件（只读取清单和解析源码，不导入模块，可在后台线程中调用）
+
+    Args:
+        plugin_directory: 插件目录
+        module_name: 模块名
+        names: 插件目录中的文件名集合（用于判断清单文件是否存在）
+
+    Returns:
+        (模块名, (插件元数据, 插件类名) 或 None, 插件类名)；有清单时不再检查插件类
+    """
+    manifest = None
+    if f"{module_name}.manifest.json" in names:
+        manifest = _read_sidecar_manifest(
+            os.path.join(plugin_directory, f"{module_name}.manifest.json"))
+    plugin_file = os.path.join(plugin_directory, f"{module_name}.py")
+    if manifest is None:
+        manifest = _read_plugin_manifest(plugin_file)
+    if manifest:
+        return module_name, manifest, None
+    return module_name, None, _file_declares_plugin(plugin_file)
+
+
+def _encode_discovery(manifest, class_name) -> dict:
+    """将插件发现结果转换为可写入缓存的字典"""
+    if manifest:
+        meta, manifest_class = manifest
+        return {'meta': meta._asdict(), 'class': manifest_class}
+    return {'meta': None, 'class': class_name}
+
+
+def _decode_discovery(record):
+    """
+    从缓存记录还原插件发现结果
+
+    Returns:
+        (插件元数据和类名 或 None, 插件类名)，记录无效时返回 None
+    """
+    try:
+        meta = record['meta']
+        if meta:
+            return (PluginMeta(**meta), record['class']), None
+        return None, record['class']
+    except (KeyError, TypeError):
+        return None
+
+
 class PluginManager(QObject):
     """
     插件管理器
     
     负责插件的加载、注册、激活和停用
+
+    扫描插件目录时只静态解析插件清单，插件模块在首次激活时才导入
     """
     
     # 信号定义
@@ -41,13 +293,44 @@ class PluginManager(QObject):
         self._plugins: Dict[str, BasePlugin] = {}  # 插件名到插件实例的映射
         self._active_plugin: Optional[str] = None  # 当前激活的插件名
         self._plugin_categories: Dict[str, List[str]] = {}  # 分类到插件名的映射
+        self._metas: Dict[str, PluginMeta] = {}  # 插件名到元数据的映射（含未加载插件）
+        self._sources: Dict[str, _PluginSource] = {}  # 插件名到插件来源的映射
+        
+        # 访问器返回的只读视图，随内部字典同步变化，无需复制
+        self._plugins_view = MappingProxyType(self._plugins)
+        self._plugin_categories_view = MappingProxyType(self._plugin_categories)
+        self._metas_view = MappingProxyType(self._metas)
+
+        # 插件发现结果缓存：插件目录 -> {插件文件名 -> {stamp, meta, class}}，首次扫描时读取
+        self._discovery_cache: Optional[Dict[str, Dict[str, dict]]] = None
+        self._discovery_cache_dirty = False
+        self._discovery_cache_save_scheduled = False
+        self._scanned_dirs = set()  # 本次运行扫描过的目录，写回时只保留这些目录的记录
 
     def clear_plugins(self):
         """清空所有插件"""
         self._plugins.clear()
         self._plugin_categories.clear()
+        self._metas.clear()
+        self._sources.clear()
         self._active_plugin = None
         logger.info("插件管理器已清空")
+
+    def reload(self):
+        """
+        重新加载前的清理：停用当前插件，丢弃已导入的插件模块和所有登记信息
+
+        之后调用 load_plugins 重新扫描插件目录，插件模块在下次激活时重新导入
+        """
+        if self._active_plugin:
+            self.deactivate_plugin(self._active_plugin)
+
+        # 移除已导入的插件模块，下次加载时重新执行源码
+        for name, source in self._sources.items():
+            if name in self._plugins and source.directory:
+                sys.modules.pop(_plugin_module_key(source.module, source.directory), None)
+
+        self.clear_plugins()
         
     def load_plugins(self, plugin_directory: str):
         """
@@ -56,44 +339,86 @@ class PluginManager(QObject):
         Args:
             plugin_directory: 插件目录路径
         """
-        if not os.path.exists(plugin_directory):
+        # 扫描插件目录，一次读取目录项及其 stat 结果，清单文件按名称集合判断是否存在；
+        # 目录不存在时由 scandir 直接报错，不再单独检查
+        try:
+            with os.scandir(plugin_directory) as it:
+                stats = {entry.name: entry.stat() for entry in it if entry.is_file()}
+        except FileNotFoundError:
             logger.warning(f"插件目录不存在: {plugin_directory}")
             return
 
         logger.info(f"开始加载插件，目录: {plugin_directory}")
+        names = frozenset(stats)
+        module_names = [filename[:-3] for filename in stats
+                        if filename.endswith('.py') and not filename.startswith('__')]
+
+        # 插件文件和清单文件的修改时间、大小与缓存一致时直接复用上次的发现结果；
+        # 打包程序的临时解压目录每次启动都不同，不缓存
+        directory = os.path.abspath(plugin_directory)
+        cacheable = not _is_bundled_dir(directory)
+        cache = {}
+        if cacheable:
+            self._scanned_dirs.add(directory)
+            cache = self._load_discovery_cache().setdefault(directory, {})
+        keys = {}
+        cached = {}
+        for module_name in module_names:
+            file_stat = stats[f"{module_name}.py"]
+            manifest_stat = stats.get(f"{module_name}.manifest.json")
+            stamp = [file_stat.st_mtime_ns, file_stat.st_size,
+                     manifest_stat.st_mtime_ns if manifest_stat else 0]
+            key = f"{module_name}.py"
+            keys[module_name] = key, stamp
+            record = cache.get(key)
+            if isinstance(record, dict) and record.get('stamp') == stamp:
+                result = _decode_discovery(record)
+                if result is not None:
+                    cached[module_name] = result
+        missing = [module_name for module_name in module_names if module_name not in cached]
+
+        # 缓存未命中的文件在后台线程中读取清单和解析源码；结果按文件顺序在当前线程登记，
+        # 模块导入和插件实例化仍在主线程执行
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pending = executor.map(
+                lambda module_name: _discover_plugin(plugin_directory, module_name, names),
+                missing)
 
-        # 扫描插件目录中的Python文件
-        for filename in os.listdir(plugin_directory):
-            if filename.endswith('.py') and not filename.startswith('__'):
-                module_name = filename[:-3]  # 去掉.py后缀
+            for module_name in module_names:
+                if module_name in cached:
+                    manifest, class_name = cached[module_name]
+                else:
+                    _, manifest, class_name = next(pending)
+                    key, stamp = keys[module_name]
+                    cache[key] = {'stamp': stamp, **_encode_discovery(manifest, class_name)}
+                    self._discovery_cache_dirty |= cacheable
 
-                # 先加载模块，获取插件实例后检查名称冲突
+                # 有清单（或能静态解析出元数据）的插件只登记，首次激活时再导入
+                if manifest:
+                    meta, manifest_class = manifest
+                    self._register(meta, _PluginSource(module_name, plugin_directory, manifest_class))
+                    logger.info(f"插件 {meta.name} 已登记，首次使用时加载")
+                    continue
+
+                # 未声明插件类的文件（如辅助模块）不导入
+                if class_name is None:
+                    logger.debug(f"{module_name}.py 中没有插件类，跳过")
+                    continue
+
+                # 无法静态解析元数据的插件立即加载，获取插件实例后检查名称冲突
                 try:
-                    plugin_instance = self._load_plugin_module(module_name, plugin_directory)
+                    plugin_instance = self._load_plugin_module(module_name, plugin_directory,
+                                                               class_name)
 
                     if plugin_instance:
                         # 获取插件的实际名称
                         plugin_name = plugin_instance.get_name()
 
-                        # 检查是否已加载同名插件
-                        if plugin_name in self._plugins:
-                            # 用户目录的插件替换开发目录的插件
-                            old_plugin = self._plugins[plugin_name]
-                            logger.info(f"插件 {plugin_name} 已被替换（从 {type(old_plugin).__module__} 到 {module_name}）")
-                            # 从分类中移除旧插件
-                            old_category = old_plugin.get_category()
-                            if old_category in self._plugin_categories and plugin_name in self._plugin_categories[old_category]:
-                                self._plugin_categories[old_category].remove(plugin_name)
-
-                        # 注册插件
+                        # 注册插件（同名插件会被替换）
+                        self._register(plugin_instance.get_meta(), _PluginSource(
+                            module_name, plugin_directory, type(plugin_instance).__name__))
                         self._plugins[plugin_name] = plugin_instance
 
-                        # 按分类组织插件
-                        category = plugin_instance.get_category()
-                        if category not in self._plugin_categories:
-                            self._plugin_categories[category] = []
-                        self._plugin_categories[category].append(plugin_name)
-
                         # 初始化插件
                         plugin_instance.initialize()
                         logger.info(f"插件 {plugin_name} 加载成功")
@@ -103,47 +428,180 @@ class PluginManager(QObject):
                     logger.error(f"加载插件模块 {module_name} 失败: {str(e)}")
                     self.plugin_error.emit(module_name, str(e))
 
-        logger.info(f"插件加载完成，共加载 {len(self._plugins)} 个插件")
+        # 清除该目录中已删除文件的缓存记录
+        current = {key for key, _ in keys.values()}
+        stale = [key for key in cache if key not in current]
+        if stale:
+            for key in stale:
+                del cache[key]
+            self._discovery_cache_dirty |= cacheable
+        self._schedule_discovery_cache_save()
+
+        logger.info(f"插件扫描完成，共 {len(self._metas)} 个插件，已加载 {len(self._plugins)} 个")
+
+    def _load_discovery_cache(self) -> Dict[str, Dict[str, dict]]:
+        """读取插件发现结果缓存（只在首次扫描时读取文件），缓存无效时返回空字典"""
+        if self._discovery_cache is None:
+            self._discovery_cache = {}
+            try:
+                with open(get_discovery_cache_file(), 'rb') as f:
+                    data = json.loads(f.read())
+                if (isinstance(data, dict) and data.get('tag') == _cache_tag() and
+                        isinstance(data.get('dirs'), dict)):
+                    self._discovery_cache = {directory: files
+                                             for directory, files in data['dirs'].items()
+                                             if isinstance(files, dict)}
+            except (OSError, ValueError):
+                pass
+        return self._discovery_cache
+
+    def _schedule_discovery_cache_save(self):
+        """安排检查并写回缓存，推迟到事件循环空闲时（所有目录扫描完成后）执行，多次扫描只写一次"""
+        if not self._discovery_cache_save_scheduled:
+            self._discovery_cache_save_scheduled = True
+            QTimer.singleShot(0, self._save_discovery_cache)
+
+    def _save_discovery_cache(self):
+        """
+        将插件发现结果缓存写回磁盘（先写临时文件再替换，避免写入中断损坏缓存）
+
+        只保留本次运行扫描过的目录；记录没有变化且没有需要丢弃的目录时不写盘
+        """
+        self._discovery_cache_save_scheduled = False
+        if self._discovery_cache is None:
+            return
+        unscanned = set(self._discovery_cache) - self._scanned_dirs
+        if not self._discovery_cache_dirty and not unscanned:
+            return
+        self._discovery_cache_dirty = False
+        for directory in unscanned:
+            del self._discovery_cache[directory]
+
+        cache_file = get_discovery_cache_file()
+        temp_file = f"{cache_file}.tmp"
+        try:
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump({'tag': _cache_tag(), 'dirs': self._discovery_cache}, f,
+                          ensure_ascii=False)
+            os.replace(temp_file, cache_file)
+        except OSError as e:
+            logger.warning(f"保存插件缓存失败: {str(e)}")
+
+    def _register(self, meta: PluginMeta, source: _PluginSource):
+        """
+        登记插件并按分类组织，已存在的同名插件会被替换
+
+        Args:
+            meta: 插件元数据
+            source: 插件来源（模块名、目录、类名）
+        """
+        plugin_name = meta.name
+        old_meta = self._metas.get(plugin_name)
+        if old_meta:
+            # 用户目录的插件替换开发目录的插件
+            logger.info(f"插件 {plugin_name} 已被替换（从 {self._sources[plugin_name].module} 到 {source.module}）")
+            old_category = old_meta.category
+            if old_category in self._plugin_categories and plugin_name in self._plugin_categories[old_category]:
+                self._plugin_categories[old_category].remove(plugin_name)
+            self._plugins.pop(plugin_name, None)
+
+        self._metas[plugin_name] = meta
+        self._sources[plugin_name] = source
+        self._plugin_categories.setdefault(meta.category, []).append(plugin_name)
+
+    def ensure_loaded(self, name: str) -> Optional[BasePlugin]:
+        """
+        确保插件已加载，未加载时按清单导入模块并创建实例
+
+        Args:
+            name: 插件名称
+
+        Returns:
+            插件实例，插件不存在或加载失败时返回None
+        """
+        plugin = self._plugins.get(name)
+        if plugin is not None:
+            return plugin
+
+        source = self._sources.get(name)
+        if source is None:
+            return None
+
+        try:
+            plugin = self._load_plugin_module(source.module, source.directory,
+                                              source.class_name)
+            if plugin is None:
+                raise ImportError(f"模块 {source.module} 中未找到插件类")
+
+            self._plugins[name] = plugin
+            plugin.initialize()
+            logger.info(f"插件 {name} 加载成功")
+            self.plugin_loaded.emit(name)
+            return plugin
+        except Exception as e:
+            logger.error(f"加载插件 {name} 失败: {str(e)}")
+            self.plugin_error.emit(name, str(e))
+            return None
         
-    def _load_plugin_module(self, module_name: str, plugin_directory: str):
+    def _load_plugin_module(self, module_name: str, plugin_directory: str,
+                            class_name: Optional[str] = None):
         """
         加载单个插件模块
 
         Args:
             module_name: 模块名称
             plugin_directory: 插件目录
+            class_name: 插件类名，为 None 时查找模块中第一个插件类
 
         Returns:
             插件实例，如果加载失败返回 None
         """
         try:
-            # 使用 spec 从文件加载模块，这样可以从用户目录加载
-            import importlib.util
+            # 使用 spec 直接从文件加载模块，不经过 sys.path 查找，这样可以从用户目录加载
             plugin_file = os.path.join(plugin_directory, f"{module_name}.py")
 
-            spec = importlib.util.spec_from_file_location(module_name, plugin_file)
+            spec = importlib.util.spec_from_file_location(
+                _plugin_module_key(module_name, plugin_directory), plugin_file)
             if spec is None or spec.loader is None:
                 raise ImportError(f"无法加载模块规范: {module_name}")
 
             module = importlib.util.module_from_spec(spec)
-            sys.modules[module_name] = module
-            spec.loader.exec_module(module)
+            sys.modules[spec.name] = module
+            try:
+                spec.loader.exec_module(module)
+            except BaseException:
+                sys.modules.pop(spec.name, None)
+                raise
         except Exception as e:
             logger.error(f"加载插件模块文件 {module_name}.py 失败: {str(e)}")
             raise
 
-        # 查找模块中的插件类
-        for name, obj in inspect.getmembers(module):
-            if (inspect.isclass(obj) and
-                issubclass(obj, BasePlugin) and
-                obj != BasePlugin):
+        # 已知类名时直接创建实例
+        if class_name:
+            obj = getattr(module, class_name, None)
+            if inspect.isclass(obj) and issubclass(obj, BasePlugin):
+                return obj()
+            return None
 
-                # 创建插件实例并返回
-                plugin_instance = obj()
-                return plugin_instance
+        # 模块通过 __plugin_class__ 声明插件类时直接使用
+        obj = getattr(module, '__plugin_class__', None)
+        if inspect.isclass(obj) and issubclass(obj, BasePlugin):
+            return obj()
 
-        # 没有找到插件类
-        return None
+        # 否则按定义顺序查找模块中的插件类（直接遍历 __dict__，不排序也不触发描述符）
+        plugin_classes = [obj for obj in module.__dict__.values()
+                          if isinstance(obj, type) and obj is not BasePlugin and
+                          issubclass(obj, BasePlugin)]
+        if not plugin_classes:
+            # 没有找到插件类
+            return None
+
+        if len(plugin_classes) > 1:
+            logger.warning(f"模块 {module_name} 中有多个插件类，使用 {plugin_classes[0].__name__}，"
+                           f"可通过 __plugin_class__ 指定")
+
+        # 创建插件实例并返回
+        return plugin_classes[0]()
                 
     def register_plugin(self, plugin: BasePlugin):
         """
@@ -153,13 +611,11 @@ class PluginManager(QObject):
             plugin: 插件实例
         """
         plugin_name = plugin.get_name()
-        self._plugins[plugin_name] = plugin
         
-        # 按分类组织插件
-        category = plugin.get_category()
-        if category not in self._plugin_categories:
-            self._plugin_categories[category] = []
-        self._plugin_categories[category].append(plugin_name)
+        # 登记并按分类组织插件
+        self._register(plugin.get_meta(), _PluginSource(
+            type(plugin).__module__, '', type(plugin).__name__))
+        self._plugins[plugin_name] = plugin
         
         # 初始化插件
         try:
@@ -182,25 +638,64 @@ class PluginManager(QObject):
         """
         return self._plugins.get(name)
         
-    def get_all_plugins(self) -> Dict[str, BasePlugin]:
+    def get_all_plugins(self) -> Mapping[str, BasePlugin]:
+        """
+        获取所有已加载的插件（只读视图，随插件增删同步变化）
+        
+        Returns:
+            插件名到插件实例的映射
+        """
+        return self._plugins_view
+        
+    def get_all_plugins_copy(self) -> Dict[str, BasePlugin]:
         """
-        获取所有已加载的插件
+        获取所有已加载插件的快照（需要在遍历时增删插件的调用方使用）
         
         Returns:
             插件名到插件实例的映射
         """
         return self._plugins.copy()
         
-    def get_plugin_categories(self) -> Dict[str, List[str]]:
+    def get_plugin_names(self) -> List[str]:
         """
-        获取插件分类
+        获取所有插件名（包括尚未加载的插件），按登记顺序排列
+        
+        Returns:
+            插件名列表
+        """
+        return list(self._metas)
+        
+    def get_plugin_meta(self, name: str) -> Optional[PluginMeta]:
+        """
+        获取插件元数据（无需加载插件）
+        
+        Args:
+            name: 插件名称
+            
+        Returns:
+            插件元数据，如果不存在则返回None
+        """
+        return self._metas.get(name)
+        
+    def get_plugin_metas(self) -> Mapping[str, PluginMeta]:
+        """
+        获取所有插件的元数据（包括尚未加载的插件，只读视图）
+        
+        Returns:
+            插件名到元数据的映射
+        """
+        return self._metas_view
+        
+    def get_plugin_categories(self) -> Mapping[str, List[str]]:
+        """
+        获取插件分类（只读视图，调用方不应修改其中的插件名列表）
         
         Returns:
             分类名到插件名列表的映射
         """
-        return self._plugin_categories.copy()
+        return self._plugin_categories_view
         
-    def activate_plugin(self, name: str) -> bool:
+    def activate_plugin(self, name: str) -> Optional[BasePlugin]:
         """
         激活指定插件
         
@@ -208,11 +703,20 @@ class PluginManager(QObject):
             name: 插件名称
             
         Returns:
-            是否成功激活
+            激活的插件实例，激活失败时返回None
         """
-        if name not in self._plugins:
+        if name not in self._metas:
             logger.warning(f"尝试激活不存在的插件: {name}")
-            return False
+            return None
+            
+        # 已处于激活状态，不重复调用 on_activate
+        if self._active_plugin == name and name in self._plugins:
+            return self._plugins[name]
+            
+        # 首次激活时加载插件
+        plugin = self.ensure_loaded(name)
+        if plugin is None:
+            return None
             
         # 如果已有插件处于激活状态，先停用它
         if self._active_plugin and self._active_plugin != name:
@@ -220,16 +724,15 @@ class PluginManager(QObject):
             
         # 激活新插件
         try:
-            plugin = self._plugins[name]
             plugin.on_activate()
             self._active_plugin = name
             logger.info(f"插件 {name} 已激活")
             self.plugin_activated.emit(name)
-            return True
+            return plugin
         except Exception as e:
             logger.error(f"激活插件 {name} 失败: {str(e)}")
             self.plugin_error.emit(name, str(e))
-            return False
+            return None
             
     def deactivate_plugin(self, name: str) -> bool:
         """
@@ -285,11 +788,16 @@ class PluginManager(QObject):
         """
         保存所有插件的状态
         
+        save_state 读取的是控件状态，必须在主线程中调用；未重写 save_state 的
+        插件只会返回空字典，直接跳过，未加载的插件没有状态可保存
+        
         Returns:
             插件名到状态数据的映射
         """
         states = {}
         for name, plugin in self._plugins.items():
+            if type(plugin).save_state is BasePlugin.save_state:
+                continue
             try:
                 states[name] = plugin.save_state()
             except Exception as e:
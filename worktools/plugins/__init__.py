@@ -8,3 +8,32 @@
 - Mac: ~/Library/Application Support/WorkTools/plugins
 - Linux: ~/.config/WorkTools/plugins
 """
+
+import importlib
+
+# 插件类名到模块名的映射：按需导入，访问 worktools.plugins.<类名> 时才加载对应模块
+# （避免导入包时连带导入 pandas、openpyxl、Pillow 等依赖）
+_LAZY = {
+    'TextProcessor': 'text_processor',
+    'FileManager': 'file_manager',
+    'SystemTools': 'system_tools',
+    'MonthlySummary': 'monthly_summary',
+    'ExcelMerger': 'excel_merger',
+    'ExcelDeduplication': 'excel_deduplication',
+    'ImageWatermarkPlugin': 'image_watermark',
+    'PluginManagerTool': 'plugin_manager_tool',
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    """首次访问插件类时导入对应模块（PEP 562）"""
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(f".{module_name}", __name__), name)
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -6,18 +6,136 @@ Excel去重工具插件
 """
 
 import os
+from itertools import islice
+import numpy as np
 import pandas as pd
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTabWidget,
                            QPushButton, QLabel, QLineEdit, QGroupBox, QCheckBox,
                            QFileDialog, QMessageBox, QProgressBar, QSplitter,
-                           QTableWidget, QTableWidgetItem, QHeaderView, QComboBox,
+                           QTableView, QHeaderView, QComboBox,
                            QTextEdit, QSpinBox, QGridLayout, QFormLayout,
                            QDialog, QDialogButtonBox, QScrollArea, QFrame, QSizePolicy,
-                           QListWidget, QListWidgetItem)
-from PyQt5.QtGui import QIcon, QFont, QStandardItemModel, QStandardItem, QColor
-from PyQt5.QtCore import Qt, QDir, QFileInfo, QThread, pyqtSignal, QSettings
+                           QListWidget, QListWidgetItem, QApplication)
+from PyQt5.QtGui import QIcon, QFont, QStandardItemModel, QStandardItem
+from PyQt5.QtCore import (Qt, QDir, QFileInfo, QThread, pyqtSignal, QAbstractTableModel,
+                          QModelIndex)
 
-from worktools.base_plugin import BasePlugin
+from worktools.base_plugin import BasePlugin, get_shared_settings
+
+# 可选：安装 python-calamine 后用其解析 Excel（Rust 实现，比 openpyxl 快且占用内存少），
+# pandas 2.2 起支持 calamine 引擎；不可用时使用 pandas 默认引擎
+try:
+    import python_calamine  # noqa: F401
+    _EXCEL_ENGINE = 'calamine' if tuple(map(int, pd.__version__.split('.')[:2])) >= (2, 2) else None
+except ImportError:
+    _EXCEL_ENGINE = None
+
+# 可选：安装 xlsxwriter 后按行流式写出结果（constant_memory 模式，内存占用与行数无关）
+try:
+    import xlsxwriter
+except ImportError:
+    xlsxwriter = None
+
+# 超过该大小的 .xlsx 文件分块读取去重，每块的行数
+CHUNKED_READ_SIZE = 50 * 1024 * 1024
+CHUNK_ROWS = 50000
+
+# 去重设置在 QSettings 中的分组名
+SETTINGS_GROUP = 'dedup'
+
+def _read_excel_fast(path, **kwargs):
+    """读取 Excel 文件，优先使用 calamine 引擎"""
+    return pd.read_excel(path, engine=_EXCEL_ENGINE, **kwargs)
+
+def _is_missing(value):
+    """判断单元格值是否为空值（None、NaN、NaT）"""
+    return value is None or value is pd.NaT or (isinstance(value, float) and value != value)
+
+def _write_excel(df, file_path):
+    """
+    将 DataFrame 写入 Excel 文件（不含索引）
+
+    安装了 xlsxwriter 时按行写出：constant_memory 模式要求按行顺序写入，
+    而 DataFrame.to_excel 按列生成单元格，因此直接调用 write_row
+    """
+    if xlsxwriter is None:
+        df.to_excel(file_path, index=False)
+        return
+        
+    workbook = xlsxwriter.Workbook(file_path, {
+        'constant_memory': True,
+        'default_date_format': 'yyyy-mm-dd hh:mm:ss',
+        'remove_timezone': True,
+    })
+    try:
+        worksheet = workbook.add_worksheet('Sheet1')
+        worksheet.write_row(0, 0, [str(column) for column in df.columns])
+        for row, values in enumerate(df.itertuples(index=False, name=None), 1):
+            worksheet.write_row(row, 0, [None if _is_missing(v) else v for v in values])
+    finally:
+        workbook.close()
+
+class PandasModel(QAbstractTableModel):
+    """只读 DataFrame 表格模型，视图只按需读取可见单元格"""
+    
+    def __init__(self, df, parent=None):
+        super().__init__(parent)
+        self._df = df
+        
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._df)
+        
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._df.columns)
+        
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and index.isValid():
+            return str(self._df.iat[index.row(), index.column()])
+        return None
+        
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return str(self._df.columns[section])
+        return str(section + 1)
+
+class HeaderProbeWorker(QThread):
+    """读取Excel表头的工作线程（只解析列名，不读取数据行）"""
+    
+    columns_ready = pyqtSignal(list)
+    error_occurred = pyqtSignal(str)
+    
+    def __init__(self, file_path):
+        super().__init__()
+        self.file_path = file_path
+        
+    def run(self):
+        """读取表头"""
+        try:
+            df = _read_excel_fast(self.file_path, nrows=0)
+            self.columns_ready.emit(df.columns.tolist())
+        except Exception as e:
+            self.error_occurred.emit(f"读取文件失败: {str(e)}")
+
+class SaveWorker(QThread):
+    """保存去重结果的工作线程"""
+    
+    saved = pyqtSignal(str)
+    error_occurred = pyqtSignal(str)
+    
+    def __init__(self, df, file_path):
+        super().__init__()
+        self.df = df
+        self.file_path = file_path
+        
+    def run(self):
+        """写出结果文件"""
+        try:
+            _write_excel(self.df, self.file_path)
+            self.saved.emit(self.file_path)
+        except Exception as e:
+            self.error_occurred.emit(f"保存失败: {str(e)}")
 
 class DeduplicationWorker(QThread):
     """Excel去重工作线程"""
@@ -26,77 +144,203 @@ class DeduplicationWorker(QThread):
     data_processed = pyqtSignal(object)
     error_occurred = pyqtSignal(str)
     
-    def __init__(self, file_path, deduplication_settings):
+    def __init__(self, file_path, deduplication_settings, df=None):
         super().__init__()
         self.file_path = file_path
         self.deduplication_settings = deduplication_settings
+        self.df = df  # 已读取的数据，提供时不再读取文件
         
     def run(self):
         """执行Excel去重"""
         try:
-            self.progress_updated.emit(10, "正在读取数据文件...")
-            
-            # 读取Excel文件
-            df = pd.read_excel(self.file_path)
+            # 大文件且保留首条时分块读取并逐块去重，内存占用与去重后的数据量相关
+            if (self.df is None and self._keep() == 'first' and
+                    self.file_path.lower().endswith(('.xlsx', '.xlsm')) and
+                    os.path.getsize(self.file_path) > CHUNKED_READ_SIZE):
+                self._run_chunked()
+                return
+                
+            # 读取Excel文件（已有同一文件的数据时直接使用）
+            df = self.df
+            if df is None:
+                self.progress_updated.emit(10, "正在读取数据文件...")
+                df = _read_excel_fast(self.file_path)
             self.progress_updated.emit(20, f"成功读取 {len(df)} 行数据，{len(df.columns)} 列")
             
             # 应用设置
             processed_df = self._apply_deduplication(df)
             
-            # 计算去重统计
-            original_count = len(df)
-            deduplicated_count = len(processed_df)
-            removed_count = original_count - deduplicated_count
-            
             self.progress_updated.emit(90, "正在完成处理...")
-            
-            # 返回结果
-            result = {
-                '原始数据': df,
-                '去重数据': processed_df,
-                '原始行数': original_count,
-                '去重后行数': deduplicated_count,
-                '删除行数': removed_count,
-                '删除比例': f"{removed_count/original_count*100:.2f}%" if original_count > 0 else "0%"
-            }
-            
-            self.progress_updated.emit(100, "处理完成")
-            self.data_processed.emit(result)
+            self._emit_result(df, processed_df, len(df))
             
         except Exception as e:
             self.error_occurred.emit(f"去重处理失败: {str(e)}")
-    
-    def _apply_deduplication(self, df):
-        """应用去重设置"""
+            
+    def _emit_result(self, df, processed_df, original_count, chunked=False):
+        """计算去重统计并发送结果"""
+        deduplicated_count = len(processed_df)
+        removed_count = original_count - deduplicated_count
+        
+        # 返回结果
+        result = {
+            '原始数据': df,
+            '去重数据': processed_df,
+            '原始行数': original_count,
+            '去重后行数': deduplicated_count,
+            '删除行数': removed_count,
+            '删除比例': f"{removed_count/original_count*100:.2f}%" if original_count > 0 else "0%",
+            '分块读取': chunked
+        }
+        
+        self.progress_updated.emit(100, "处理完成")
+        self.data_processed.emit(result)
+        
+    def _run_chunked(self):
+        """
+        分块读取并去重（只保留首条）
+        
+        用 openpyxl 只读模式逐行读取，每 CHUNK_ROWS 行组成一块，记录已出现的键值，
+        每块只保留键值未出现过的行；原始数据只保留第一块用于预览
+        """
+        from openpyxl import load_workbook
+        
+        self.progress_updated.emit(10, "正在分块读取数据文件...")
+        
+        # 列名由 pandas 解析表头得到（空表头、重复列名的命名规则与表头探测和完整读取一致）
+        columns = _read_excel_fast(self.file_path, nrows=0).columns.tolist()
+        
+        workbook = load_workbook(self.file_path, read_only=True, data_only=True)
+        try:
+            rows = workbook.worksheets[0].iter_rows(values_only=True)
+            header = next(rows, None)
+            if header is None:
+                empty_df = pd.DataFrame()
+                self._emit_result(empty_df, empty_df, 0, chunked=True)
+                return
+            
+            seen = set()
+            kept_chunks = []
+            first_chunk = None
+            original_count = 0
+            while True:
+                batch = list(islice(rows, CHUNK_ROWS))
+                if not batch:
+                    break
+                # 保留 openpyxl 读出的单元格原值，列数与 pandas 解析的表头对齐；
+                # 再推断列类型，使键数据的类型（及忽略大小写/空格时规范化的文本列）与完整读取一致
+                chunk = pd.DataFrame(batch, dtype=object).reindex(columns=range(len(columns)))
+                chunk.columns = columns
+                chunk = chunk.infer_objects()
+                if first_chunk is None:
+                    first_chunk = chunk
+                original_count += len(chunk)
+                
+                key_df = self._key_frame(chunk)
+                if key_df is None:
+                    return
+                
+                # 保留本块中首次出现且之前各块未出现过的行；以键值元组判断，按 Python 相等规则比较：
+                # 1、1.0 与 True 视为相同（与 duplicated 处理 object 列时一致），1 与 '1' 不同
+                mask = np.zeros(len(key_df), dtype=bool)
+                for i, key in enumerate(key_df.itertuples(index=False, name=None)):
+                    if key not in seen:
+                        seen.add(key)
+                        mask[i] = True
+                kept_chunks.append(chunk[mask])
+                
+                self.progress_updated.emit(
+                    min(85, 10 + len(kept_chunks)),
+                    f"已读取 {original_count} 行，保留 {len(seen)} 行")
+        finally:
+            workbook.close()
+            
+        self.progress_updated.emit(90, "正在完成处理...")
+        processed_df = (pd.concat(kept_chunks, ignore_index=True).infer_objects()
+                        if kept_chunks else pd.DataFrame(columns=columns))
+        self._emit_result(first_chunk if first_chunk is not None else processed_df,
+                          processed_df, original_count, chunked=True)
+        
+    def _keep(self):
+        """保留方式：'first' 或 'last'"""
+        return 'last' if self.deduplication_settings['keep_method'] == '保留最后一条' else 'first'
+        
+    def _key_frame(self, df):
+        """
+        构建去重依据的键数据（未指定列时按全行匹配）
+        
+        忽略大小写/空格时在键数据副本上规范化文本列，输出仍保留原始值
+        
+        Returns:
+            键数据，指定的列都不存在时返回 None
+        """
         settings = self.deduplication_settings
         
-        # 获取去重列
-        if settings['deduplication_mode'] == '全行匹配':
-            # 全行去重
-            deduplicated_df = df.drop_duplicates()
-        elif settings['deduplication_mode'] == '指定列':
-            # 指定列去重
+        key_df = df
+        if settings['deduplication_mode'] == '指定列':
             columns = settings['deduplication_columns']
             if columns:
                 # 只使用存在的列
                 existing_columns = [col for col in columns if col in df.columns]
-                if existing_columns:
-                    deduplicated_df = df.drop_duplicates(subset=existing_columns)
-                else:
+                if not existing_columns:
                     self.error_occurred.emit("指定的列不存在于数据中")
-                    return df
-            else:
-                deduplicated_df = df
-        else:
-            deduplicated_df = df
-            
-        # 保留首条或最后一条
-        if settings['keep_method'] == '保留最后一条':
-            deduplicated_df = deduplicated_df.drop_duplicates(keep='last')
-        else:
-            deduplicated_df = deduplicated_df.drop_duplicates(keep='first')
+                    return None
+                key_df = df[existing_columns]
+                    
+        ignore_case = settings.get('ignore_case', False)
+        ignore_spaces = settings.get('ignore_spaces', False)
+        if ignore_case or ignore_spaces:
+            key_df = key_df.copy()
+            for i, dtype in enumerate(key_df.dtypes):
+                # 文本列在 pandas 2 中为 object 类型，在 pandas 3（或启用 future.infer_string）中为 str 类型
+                if dtype != object and not pd.api.types.is_string_dtype(dtype):
+                    continue
+                original = key_df.iloc[:, i]
+                # object 列可能混有数字、布尔等值，只规范化其中的字符串，其余值保持原样
+                # （否则 1 与 True 会被转成不同的字符串，且结果取决于同列其他值的类型）
+                is_text = None
+                if dtype == object and pd.api.types.infer_dtype(original, skipna=True) != 'string':
+                    is_text = original.map(lambda value: isinstance(value, str)).to_numpy(dtype=bool)
+                    if not is_text.any():
+                        continue
+                # 使用向量化的 .str 字符串操作，不逐行调用 Python 函数
+                column = original.astype('string')
+                if ignore_spaces:
+                    column = column.str.replace(r'\s+', '', regex=True)
+                if ignore_case:
+                    column = column.str.casefold()
+                if is_text is not None:
+                    column = original.mask(is_text, column.astype(object))
+                key_df.isetitem(i, column)
+        return key_df
+    
+    def _apply_deduplication(self, df):
+        """应用去重设置"""
+        keep = self._keep()
+        key_df = self._key_frame(df)
+        if key_df is None:
+            return df
+        
+        # 每行计算一个 64 位哈希值，先在连续的 uint64 数组上筛出可能重复的行；
+        # categorize=True 时文本列先分解为整数编码，只对不重复的值计算字符串哈希
+        try:
+            row_hashes = pd.util.hash_pandas_object(key_df, index=False,
+                                                    categorize=True).to_numpy()
+        except TypeError:
+            # 含无法哈希的单元格时退回 duplicated（一次调用判断所有键列）
+            mask = ~key_df.duplicated(keep=keep)
+            return df.loc[mask].reset_index(drop=True)
+        
+        # 哈希值只出现一次的行一定不重复，直接保留
+        _, inverse, counts = np.unique(row_hashes, return_inverse=True, return_counts=True)
+        candidates = counts[inverse] > 1
+        if not candidates.any():
+            return df.reset_index(drop=True)
             
-        return deduplicated_df.reset_index(drop=True)
+        # 哈希相同的行再用 duplicated 按原值确认：混合类型列中 1、'1'、1.0 会被转成相同文本
+        # 得到相同哈希，64 位哈希也可能碰撞，这些行不能仅凭哈希删除
+        drop = np.zeros(len(df), dtype=bool)
+        drop[candidates] = key_df[candidates].duplicated(keep=keep).to_numpy()
+        return df[~drop].reset_index(drop=True)
 
 class DeduplicationSettingsDialog(QDialog):
     """去重设置对话框"""
@@ -200,6 +444,11 @@ class ExcelDeduplication(BasePlugin):
         self.deduplicated_data = None
         self.settings = None
         
+        # 最近读取的数据：(文件路径, 修改时间) -> DataFrame，文件未变化时再次去重无需重新读取
+        self._df_cache = {}
+        self._pending_df_key = None
+        self.header_worker = None
+        
     def get_name(self) -> str:
         """返回插件显示名称"""
         return self._name
@@ -318,7 +567,7 @@ class ExcelDeduplication(BasePlugin):
         original_group = QGroupBox("原始数据")
         original_layout = QVBoxLayout(original_group)
         
-        self.original_table = QTableWidget()
+        self.original_table = QTableView()
         self.original_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         self.original_table.setAlternatingRowColors(True)
         original_layout.addWidget(self.original_table)
@@ -327,7 +576,7 @@ class ExcelDeduplication(BasePlugin):
         deduplicated_group = QGroupBox("去重后数据")
         deduplicated_layout = QVBoxLayout(deduplicated_group)
         
-        self.deduplicated_table = QTableWidget()
+        self.deduplicated_table = QTableView()
         self.deduplicated_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         self.deduplicated_table.setAlternatingRowColors(True)
         deduplicated_layout.addWidget(self.deduplicated_table)
@@ -375,35 +624,63 @@ class ExcelDeduplication(BasePlugin):
             QMessageBox.warning(self, "警告", "请先选择数据文件")
             return
             
+        # 正在读取表头时忽略重复点击
+        if self.header_worker is not None and self.header_worker.isRunning():
+            return
+            
+        # 文件未变化且已读取过数据时直接使用缓存的列名
+        file_path = self.file_path_edit.text()
         try:
-            # 读取文件以获取列名
-            df = pd.read_excel(self.file_path_edit.text())
-            columns = df.columns.tolist()
+            df = self._df_cache.get((file_path, os.stat(file_path).st_mtime_ns))
+        except OSError:
+            df = None
+        if df is not None:
+            self._open_settings_dialog(df.columns.tolist())
+            return
             
-            # 显示设置对话框
-            dialog = DeduplicationSettingsDialog(columns, self.settings or {}, self)
+        # 在后台线程中解析表头，界面保持响应
+        self.status_label.setText("读取表头...")
+        QApplication.setOverrideCursor(Qt.WaitCursor)
+        self.header_worker = HeaderProbeWorker(file_path)
+        self.header_worker.columns_ready.connect(self._on_columns_ready)
+        self.header_worker.error_occurred.connect(self._on_header_error)
+        self.header_worker.start()
+        
+    def _on_columns_ready(self, columns):
+        """表头读取完成"""
+        QApplication.restoreOverrideCursor()
+        self.status_label.setText("就绪")
+        self._open_settings_dialog(columns)
+        
+    def _on_header_error(self, error_message):
+        """表头读取失败"""
+        QApplication.restoreOverrideCursor()
+        self.status_label.setText("就绪")
+        QMessageBox.critical(self, "错误", error_message)
+        
+    def _open_settings_dialog(self, columns):
+        """按列名显示设置对话框"""
+        dialog = DeduplicationSettingsDialog(columns, self.settings or {}, self)
+        
+        if dialog.exec_() == QDialog.Accepted:
+            # 保存设置
+            self.settings = dialog.get_settings()
             
-            if dialog.exec_() == QDialog.Accepted:
-                # 保存设置
-                self.settings = dialog.get_settings()
-                
-                # 保存到应用设置
-                for key, value in self.settings.items():
-                    self.app_settings.setValue(key, value)
-                    
-                self.app_settings.sync()
-                
-                # 更新显示
-                self._update_settings_display()
-                
-                QMessageBox.information(self, "设置", "设置已更新")
-                
-        except Exception as e:
-            QMessageBox.critical(self, "错误", f"读取文件失败: {str(e)}")
+            # 保存到应用设置（在 dedup 分组中批量写入，最后同步一次）
+            self.app_settings.beginGroup(SETTINGS_GROUP)
+            for key, value in self.settings.items():
+                self.app_settings.setValue(key, value)
+            self.app_settings.endGroup()
+            self.app_settings.sync()
+            
+            # 更新显示
+            self._update_settings_display()
+            
+            QMessageBox.information(self, "设置", "设置已更新")
             
     def _load_settings(self):
         """加载设置"""
-        self.app_settings = QSettings("WorkTools", "ExcelDeduplication")
+        self.app_settings = get_shared_settings("ExcelDeduplication")
         
         # 默认设置
         self.settings = {
@@ -414,10 +691,16 @@ class ExcelDeduplication(BasePlugin):
             'ignore_spaces': False
         }
         
-        # 从设置中加载
+        # 从设置中加载（保存在 dedup 分组中；旧版本保存在根级别，分组为空时从根级别读取）
+        self.app_settings.beginGroup(SETTINGS_GROUP)
+        prefix = f"{SETTINGS_GROUP}/" if self.app_settings.childKeys() else ""
+        self.app_settings.endGroup()
         for key, default_value in self.settings.items():
-            value = self.app_settings.value(key, default_value)
-            self.settings[key] = value
+            if isinstance(default_value, bool):
+                # QSettings 从 INI/注册表读回的布尔值是字符串，按 bool 类型读取
+                self.settings[key] = self.app_settings.value(prefix + key, default_value, type=bool)
+            else:
+                self.settings[key] = self.app_settings.value(prefix + key, default_value)
             
         self._update_settings_display()
         
@@ -443,8 +726,10 @@ class ExcelDeduplication(BasePlugin):
         self.progress_bar.setValue(0)
         self.status_label.setText("开始处理...")
         
-        # 创建并启动工作线程
-        self.worker = DeduplicationWorker(file_path, self.settings)
+        # 创建并启动工作线程（文件未变化时复用上次读取的数据）
+        self._pending_df_key = (file_path, os.stat(file_path).st_mtime_ns)
+        self.worker = DeduplicationWorker(file_path, self.settings,
+                                          self._df_cache.get(self._pending_df_key))
         self.worker.progress_updated.connect(self._on_progress_updated)
         self.worker.data_processed.connect(self._on_data_processed)
         self.worker.error_occurred.connect(self._on_error_occurred)
@@ -460,6 +745,10 @@ class ExcelDeduplication(BasePlugin):
         self.data = result['原始数据']
         self.deduplicated_data = result['去重数据']
         
+        # 只缓存最近一个文件的完整数据（分块读取时原始数据只有第一块，不缓存）
+        if not result.get('分块读取'):
+            self._df_cache = {self._pending_df_key: self.data}
+        
         # 更新统计信息
         self.original_rows_label.setText(f"原始行数: {result['原始行数']}")
         self.deduplicated_rows_label.setText(f"去重后行数: {result['去重后行数']}")
@@ -483,44 +772,16 @@ class ExcelDeduplication(BasePlugin):
         if self.data is None or self.deduplicated_data is None:
             return
             
-        # 限制显示行数
-        max_rows = 100
-        
-        # 原始数据
-        original_display = self.data.head(max_rows)
-        self.original_table.setRowCount(len(original_display))
-        self.original_table.setColumnCount(len(original_display.columns))
-        self.original_table.setHorizontalHeaderLabels(original_display.columns)
-        
-        for i in range(len(original_display)):
-            for j in range(len(original_display.columns)):
-                value = str(original_display.iloc[i, j])
-                item = QTableWidgetItem(value)
-                self.original_table.setItem(i, j, item)
-                
-        if len(self.data) > max_rows:
-            self.original_table.setRowCount(max_rows + 1)
-            info_item = QTableWidgetItem(f"...(共 {len(self.data)} 行，仅显示前 {max_rows} 行)")
-            info_item.setBackground(QColor(240, 240, 240))
-            self.original_table.setItem(max_rows, 0, info_item)
-            
-        # 去重后数据
-        deduplicated_display = self.deduplicated_data.head(max_rows)
-        self.deduplicated_table.setRowCount(len(deduplicated_display))
-        self.deduplicated_table.setColumnCount(len(deduplicated_display.columns))
-        self.deduplicated_table.setHorizontalHeaderLabels(deduplicated_display.columns)
-        
-        for i in range(len(deduplicated_display)):
-            for j in range(len(deduplicated_display.columns)):
-                value = str(deduplicated_display.iloc[i, j])
-                item = QTableWidgetItem(value)
-                self.deduplicated_table.setItem(i, j, item)
-                
-        if len(self.deduplicated_data) > max_rows:
-            self.deduplicated_table.setRowCount(max_rows + 1)
-            info_item = QTableWidgetItem(f"...(共 {len(self.deduplicated_data)} 行，仅显示前 {max_rows} 行)")
-            info_item.setBackground(QColor(240, 240, 240))
-            self.deduplicated_table.setItem(max_rows, 0, info_item)
+        # 表格模型直接读取 DataFrame，视图只取可见单元格，无需逐格创建表格项
+        self._set_table_data(self.original_table, self.data)
+        self._set_table_data(self.deduplicated_table, self.deduplicated_data)
+        
+    def _set_table_data(self, table, df):
+        """为表格视图设置新的数据模型，并释放上一次的模型（及其引用的 DataFrame）"""
+        old_model = table.model()
+        table.setModel(PandasModel(df, table))
+        if old_model is not None:
+            old_model.deleteLater()
                 
     def _save_results(self):
         """保存结果"""
@@ -533,11 +794,25 @@ class ExcelDeduplication(BasePlugin):
         )
         
         if file_path:
-            try:
-                self.deduplicated_data.to_excel(file_path, index=False)
-                QMessageBox.information(self, "成功", f"结果已保存到: {file_path}")
-            except Exception as e:
-                QMessageBox.critical(self, "错误", f"保存失败: {str(e)}")
+            # 在后台线程中写出文件，保存期间禁用保存按钮
+            self.save_button.setEnabled(False)
+            self.status_label.setText("正在保存结果...")
+            self.save_worker = SaveWorker(self.deduplicated_data, file_path)
+            self.save_worker.saved.connect(self._on_results_saved)
+            self.save_worker.error_occurred.connect(self._on_save_error)
+            self.save_worker.start()
+            
+    def _on_results_saved(self, file_path):
+        """保存完成"""
+        self.save_button.setEnabled(True)
+        self.status_label.setText("就绪")
+        QMessageBox.information(self, "成功", f"结果已保存到: {file_path}")
+        
+    def _on_save_error(self, error_message):
+        """保存失败"""
+        self.save_button.setEnabled(True)
+        self.status_label.setText("就绪")
+        QMessageBox.critical(self, "错误", error_message)
                 
     def save_state(self) -> dict:
         """保存插件状态"""
@@ -553,4 +828,8 @@ class ExcelDeduplication(BasePlugin):
             self.tab_widget.setCurrentIndex(state['current_tab'])
             
         if 'file_path' in state:
-            self.file_path_edit.setText(state['file_path'])
\ No newline at end of file
+            self.file_path_edit.setText(state['file_path'])
+
+
+# 插件管理器直接按此属性获取插件类
+__plugin_class__ = ExcelDeduplication
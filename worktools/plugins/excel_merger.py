@@ -16,9 +16,9 @@ from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTabWidget,
                            QDialog, QDialogButtonBox, QScrollArea, QFrame, QSizePolicy,
                            QListWidget, QListWidgetItem)
 from PyQt5.QtGui import QIcon, QFont, QStandardItemModel, QStandardItem, QColor
-from PyQt5.QtCore import Qt, QDir, QFileInfo, QThread, pyqtSignal, QSettings
+from PyQt5.QtCore import Qt, QDir, QFileInfo, QThread, pyqtSignal
 
-from worktools.base_plugin import BasePlugin
+from worktools.base_plugin import BasePlugin, get_shared_settings
 
 class ExcelMergerWorker(QThread):
     """Excel合并工作线程"""
@@ -535,7 +535,7 @@ class ExcelMerger(BasePlugin):
         
     def _load_settings(self):
         """加载设置"""
-        self.app_settings = QSettings("WorkTools", "ExcelMerger")
+        self.app_settings = get_shared_settings("ExcelMerger")
         
         # 默认设置
         self.settings = {
@@ -833,4 +833,8 @@ class ExcelMerger(BasePlugin):
             self._on_merge_mode_changed(state['merge_mode'])
             
         if 'file_path' in state and hasattr(self, 'single_file_edit'):
-            self.single_file_edit.setText(state['file_path'])
\ No newline at end of file
+            self.single_file_edit.setText(state['file_path'])
+
+
+# 插件管理器直接按此属性获取插件类
+__plugin_class__ = ExcelMerger
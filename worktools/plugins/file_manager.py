@@ -856,4 +856,8 @@ class FileManager(BasePlugin):
                     
                 self.hash_result.setText(f"SHA256: {sha256_hash.hexdigest()}")
         except Exception as e:
-            QMessageBox.warning(self, "错误", f"计算SHA256失败: {str(e)}")
\ No newline at end of file
+            QMessageBox.warning(self, "错误", f"计算SHA256失败: {str(e)}")
+
+
+# 插件管理器直接按此属性获取插件类
+__plugin_class__ = FileManager
@@ -23,7 +23,6 @@ from PyQt5.QtCore import Qt, QThread, pyqtSignal, QDateTime
 from PyQt5.QtGui import QColor
 
 from worktools.base_plugin import BasePlugin
-from worktools.api_settings_dialog import APISettingsDialog
 
 
 class WeatherLocationWorker(QThread):
@@ -54,6 +53,7 @@ class WeatherLocationWorker(QThread):
     def _get_location(self):
         """获取地理位置信息（基于IP）"""
         # 获取API Keys
+        from worktools.api_settings_dialog import APISettingsDialog
         api_keys = APISettingsDialog.get_api_keys()
         baidu_key = api_keys.get('baidu', '')
         gaode_key = api_keys.get('gaode', '')
@@ -1217,5 +1217,10 @@ class ImageWatermarkPlugin(BasePlugin):
         
     def _show_settings_dialog(self):
         """显示设置对话框（API配置）"""
+        from worktools.api_settings_dialog import APISettingsDialog
         dialog = APISettingsDialog(self)
         dialog.exec_()
+
+
+# 插件管理器直接按此属性获取插件类
+__plugin_class__ = ImageWatermarkPlugin
@@ -17,7 +17,7 @@ from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTabWidget,
 from PyQt5.QtGui import QIcon, QFont, QStandardItemModel, QStandardItem
 from PyQt5.QtCore import Qt, QDir, QFileInfo, QThread, pyqtSignal, QSettings
 
-from worktools.base_plugin import BasePlugin
+from worktools.base_plugin import BasePlugin, get_shared_settings
 
 class SummaryWorker(QThread):
     """数据处理工作线程"""
@@ -207,7 +207,7 @@ class SettingsDialog(QDialog):
         self.setModal(True)
         self.resize(500, 400)
         
-        self.settings = QSettings("WorkTools", "MonthlySummary")
+        self.settings = get_shared_settings("MonthlySummary")
         
         layout = QVBoxLayout(self)
         
@@ -540,7 +540,7 @@ class MonthlySummary(BasePlugin):
             
     def _load_settings(self):
         """加载设置"""
-        self.settings = QSettings("WorkTools", "MonthlySummary")
+        self.settings = get_shared_settings("MonthlySummary")
         
     def _process_data(self):
         """处理数据"""
@@ -660,4 +660,8 @@ class MonthlySummary(BasePlugin):
             self.file_path_edit.setText(state['file_path'])
             
         if 'auto_confirm' in state:
-            self.auto_confirm_check.setChecked(state['auto_confirm'])
\ No newline at end of file
+            self.auto_confirm_check.setChecked(state['auto_confirm'])
+
+
+# 插件管理器直接按此属性获取插件类
+__plugin_class__ = MonthlySummary
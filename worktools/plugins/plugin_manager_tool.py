@@ -4,7 +4,6 @@
 """
 
 import os
-import sys
 import json
 import zipfile
 import logging
@@ -13,34 +12,24 @@ from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
                                QLabel, QPushButton, QProgressBar, QMessageBox,
                                QTableWidget, QTableWidgetItem, QHeaderView,
                                QLineEdit, QComboBox, QDialog, QDialogButtonBox)
-from PyQt5.QtCore import Qt, QTimer, QThread, pyqtSignal, QSettings
+from PyQt5.QtCore import Qt, QTimer, QThread, pyqtSignal
 from PyQt5.QtGui import QIcon
 import requests
 
-from worktools.base_plugin import BasePlugin
+from worktools.base_plugin import BasePlugin, get_shared_settings
+from worktools.plugin_manager import get_user_plugins_dir
 
 logger = logging.getLogger(__name__)
 
+# 运行中的插件列表获取线程。线程不以插件控件为父对象（控件被释放时不会连带销毁运行中的线程），
+# 由这里持有引用直到线程结束
+_running_list_workers = set()
 
-def get_user_plugins_dir():
-    """获取用户插件目录"""
-    # Windows: %APPDATA%/WorkTools/plugins
-    # Mac: ~/Library/Application Support/WorkTools/plugins
-    # Linux: ~/.config/WorkTools/plugins
-    if sys.platform == 'win32':
-        base_dir = os.environ.get('APPDATA', os.path.expanduser('~'))
-    elif sys.platform == 'darwin':
-        base_dir = os.path.expanduser('~/Library/Application Support')
-    else:
-        base_dir = os.path.expanduser('~/.config')
 
-    plugins_dir = os.path.join(base_dir, 'WorkTools', 'plugins')
-
-    # 确保目录存在
-    if not os.path.exists(plugins_dir):
-        os.makedirs(plugins_dir)
-
-    return plugins_dir
+def _release_list_worker(worker):
+    """插件列表获取线程结束后释放"""
+    _running_list_workers.discard(worker)
+    worker.deleteLater()
 
 
 class PluginManagerSettingsDialog(QDialog):
@@ -50,7 +39,7 @@ class PluginManagerSettingsDialog(QDialog):
         super().__init__(parent)
         self.setWindowTitle("插件管理器设置")
         self.setMinimumSize(500, 200)
-        self.settings = QSettings("WorkTools", "PyQtWorkTools")
+        self.settings = get_shared_settings()
         
         self._setup_ui()
         self._load_settings()
@@ -103,8 +92,7 @@ class PluginManagerSettingsDialog(QDialog):
         
     def _load_settings(self):
         """加载设置"""
-        repo_url = self.settings.value("plugin_repo_url", "")
-        if repo_url:
+        if repo_url := self.settings.value("plugin_repo_url", ""):
             self.repo_url_edit.setText(repo_url)
             
     def save_settings(self):
@@ -185,6 +173,40 @@ class PluginDownloadWorker(QThread):
             self.finished.emit(False, "", self.plugin_id)
 
 
+class PluginListWorker(QThread):
+    """获取插件列表的工作线程（网络请求和 JSON 解析不占用界面线程）"""
+    
+    list_loaded = pyqtSignal(list)   # 插件列表
+    error_occurred = pyqtSignal(str)  # 错误信息
+    
+    def __init__(self, repo_url: str, parent=None):
+        super().__init__(parent)
+        self.repo_url = repo_url
+        
+    def run(self):
+        """获取插件列表"""
+        try:
+            logger.info(f"从远程仓库获取插件列表: {self.repo_url}")
+            
+            # 检查是否是本地文件
+            if self.repo_url.startswith('file://'):
+                # 读取本地文件
+                file_path = self.repo_url[7:]  # 去掉 "file://" 前缀
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            else:
+                # 读取远程文件
+                response = requests.get(self.repo_url, timeout=10)
+                response.raise_for_status()
+                data = response.json()
+            
+            self.list_loaded.emit(data.get('plugins', []))
+            
+        except Exception as e:
+            logger.error(f"获取插件列表失败: {str(e)}")
+            self.error_occurred.emit(str(e))
+
+
 class PluginManagerTool(BasePlugin):
     """插件管理工具"""
     
@@ -197,6 +219,7 @@ class PluginManagerTool(BasePlugin):
         # 默认使用本地测试仓库
         self.plugin_repo_url = "file://d:/work-tools/test_server/plugins/plugins.json"
         self.download_worker = None
+        self.list_worker = None
         self._is_first_load = True  # 标记是否是首次加载
         # 注意：不要在这里调用 _setup_ui()，由 BasePlugin.initialize() 统一调用
         
@@ -352,9 +375,7 @@ class PluginManagerTool(BasePlugin):
         
     def _load_settings(self):
         """加载设置"""
-        settings = QSettings("WorkTools", "PyQtWorkTools")
-        repo_url = settings.value("plugin_repo_url", "")
-        if repo_url:
+        if repo_url := get_shared_settings().value("plugin_repo_url", ""):
             self.plugin_repo_url = repo_url
             
     def _show_settings_dialog(self):
@@ -373,40 +394,48 @@ class PluginManagerTool(BasePlugin):
         self.plugins_table.setRowCount(0)
         self.remote_plugins = []
         
-        # 强制更新UI
-        from PyQt5.QtWidgets import QApplication
-        QApplication.processEvents()
+        # 同一仓库的获取尚未完成时不重复发起请求
+        if self.list_worker is not None and self.list_worker.repo_url == self.plugin_repo_url:
+            return
         
-        try:
-            logger.info(f"从远程仓库获取插件列表: {self.plugin_repo_url}")
-            
-            # 检查是否是本地文件
-            if self.plugin_repo_url.startswith('file://'):
-                # 读取本地文件
-                file_path = self.plugin_repo_url[7:]  # 去掉 "file://" 前缀
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-            else:
-                # 读取远程文件
-                response = requests.get(self.plugin_repo_url, timeout=10)
-                response.raise_for_status()
-                data = response.json()
-            
-            self.remote_plugins = data.get('plugins', [])
-            logger.info(f"获取到 {len(self.remote_plugins)} 个插件")
-            
-            # 获取已安装插件列表
-            self.local_plugins = self._get_installed_plugins()
-            
-            # 填充表格
-            self._fill_plugin_table()
-            
-            self.status_label.setText(f"共找到 {len(self.remote_plugins)} 个插件，已安装 {len(self.local_plugins)} 个")
-            
-        except Exception as e:
-            logger.error(f"获取插件列表失败: {str(e)}")
-            self.status_label.setText(f"获取插件列表失败: {str(e)}")
-            # 不显示警告对话框，只显示状态标签
+        # 在工作线程中获取插件列表，界面保持响应；线程不设父对象，结束后自行释放。
+        # 本插件先被释放时，PyQt 会自动断开连接到它的槽的信号
+        worker = PluginListWorker(self.plugin_repo_url)
+        worker.list_loaded.connect(self._on_plugin_list_loaded)
+        worker.error_occurred.connect(self._on_plugin_list_error)
+        worker.finished.connect(lambda: _release_list_worker(worker))
+        _running_list_workers.add(worker)
+        self.list_worker = worker
+        worker.start()
+        
+    def _take_list_result(self) -> bool:
+        """当前结果是否来自最新的获取请求（仓库地址变更后旧请求的结果丢弃）"""
+        if self.sender() is not self.list_worker:
+            return False
+        self.list_worker = None
+        return True
+        
+    def _on_plugin_list_loaded(self, plugins: list):
+        """插件列表获取完成"""
+        if not self._take_list_result():
+            return
+        self.remote_plugins = plugins
+        logger.info(f"获取到 {len(self.remote_plugins)} 个插件")
+        
+        # 获取已安装插件列表
+        self.local_plugins = self._get_installed_plugins()
+        
+        # 填充表格
+        self._fill_plugin_table()
+        
+        self.status_label.setText(f"共找到 {len(self.remote_plugins)} 个插件，已安装 {len(self.local_plugins)} 个")
+        
+    def _on_plugin_list_error(self, error_msg: str):
+        """插件列表获取失败"""
+        if not self._take_list_result():
+            return
+        # 不显示警告对话框，只显示状态标签
+        self.status_label.setText(f"获取插件列表失败: {error_msg}")
             
     def _get_installed_plugins(self) -> List[str]:
         """获取已安装的插件，返回插件ID列表（文件名即插件ID）"""
@@ -778,3 +807,7 @@ class PluginManagerTool(BasePlugin):
     def _hide_operation_panel(self):
         """隐藏操作面板"""
         self.operation_panel.setVisible(False)
+
+
+# 插件管理器直接按此属性获取插件类
+__plugin_class__ = PluginManagerTool
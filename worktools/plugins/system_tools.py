@@ -760,4 +760,8 @@ class SystemTools(BasePlugin):
     def restore_state(self, state: dict):
         """恢复插件状态"""
         if 'current_tab' in state:
-            self.tab_widget.setCurrentIndex(state['current_tab'])
\ No newline at end of file
+            self.tab_widget.setCurrentIndex(state['current_tab'])
+
+
+# 插件管理器直接按此属性获取插件类
+__plugin_class__ = SystemTools
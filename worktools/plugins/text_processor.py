@@ -488,4 +488,8 @@ class TextProcessor(BasePlugin):
         
         current_text = self.generator_result_text.toPlainText()
         new_text = f"{current_text}\n日期时间: {datetime_str}" if current_text else f"日期时间: {datetime_str}"
-        self.generator_result_text.setPlainText(new_text)
\ No newline at end of file
+        self.generator_result_text.setPlainText(new_text)
+
+
+# 插件管理器直接按此属性获取插件类
+__plugin_class__ = TextProcessor
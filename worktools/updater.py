@@ -7,7 +7,6 @@
 
 import os
 import sys
-import json
 import urllib.request
 import urllib.error
 import zipfile
@@ -20,6 +19,8 @@ from PyQt5.QtGui import QFont
 
 import logging
 
+from .json_utils import json_loads
+
 logger = logging.getLogger(__name__)
 
 
@@ -44,7 +45,7 @@ class UpdateChecker(QThread):
             )
             
             with urllib.request.urlopen(req, timeout=10) as response:
-                server_info = json.loads(response.read().decode('utf-8'))
+                server_info = json_loads(response.read())
             
             # 比较版本
             latest_version = server_info.get('version', current_version)
@@ -80,8 +81,8 @@ class UpdateChecker(QThread):
             # 尝试从version.json读取
             version_file = self._get_resource_path('version.json')
             if os.path.exists(version_file):
-                with open(version_file, 'r', encoding='utf-8') as f:
-                    info = json.load(f)
+                with open(version_file, 'rb') as f:
+                    info = json_loads(f.read())
                     return info.get('version', '0.0.0')
         except Exception as e:
             logger.error(f"读取版本文件失败: {e}")
@@ -94,8 +95,8 @@ class UpdateChecker(QThread):
         try:
             version_file = self._get_resource_path('version.json')
             if os.path.exists(version_file):
-                with open(version_file, 'r', encoding='utf-8') as f:
-                    info = json.load(f)
+                with open(version_file, 'rb') as f:
+                    info = json_loads(f.read())
                     url = info.get('update_url', '')
                     if url and url != 'https://your-server.com/updates/version.json':
                         return url
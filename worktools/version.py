@@ -0,0 +1,24 @@
+# -*- coding: utf-8 -*-
+
+"""
+版本信息
+读取应用根目录下的 version.json，应用主类和插件管理器共用
+"""
+
+import os
+import functools
+
+from .json_utils import json_loads
+
+# 应用根目录（version.json 所在目录），模块导入时计算一次
+_BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@functools.lru_cache(maxsize=1)
+def load_version() -> dict:
+    """读取 version.json，结果缓存，读取失败时返回空字典"""
+    try:
+        with open(os.path.join(_BASE_DIR, 'version.json'), 'rb') as f:
+            return json_loads(f.read())
+    except Exception:
+        return {}
@@ -146,12 +146,19 @@ class Workspace(QWidget):
             self.stacked_widget.setCurrentIndex(self.empty_index)
             self.title_label.setText("请选择功能")
             self.settings_button.setEnabled(False)
+            
+        # 从映射中移除
+        del self._plugins[plugin_name]
+        
+        logger.info(f"插件 {plugin_name} 已从工作区移除")
 
     def clear_plugins(self):
-        """清空所有插件"""
-        # 移除所有插件控件
-        for plugin_name, plugin_info in self._plugins.items():
-            self.stacked_widget.removeWidget(plugin_info['widget'])
+        """清空所有插件（只移除插件控件，工作区本身和空状态页保留）"""
+        # 移除并释放所有插件控件
+        for plugin_info in self._plugins.values():
+            widget = plugin_info['widget']
+            self.stacked_widget.removeWidget(widget)
+            widget.deleteLater()
 
         # 清空插件字典
         self._plugins.clear()
@@ -163,25 +170,24 @@ class Workspace(QWidget):
         self.settings_button.setEnabled(False)
 
         logger.info("工作区插件已清空")
-            
-        # 从映射中移除
-        del self._plugins[plugin_name]
-        
-        logger.info(f"插件 {plugin_name} 已从工作区移除")
         
-    def show_plugin(self, plugin_name: str) -> bool:
+    def show_plugin(self, plugin_name: str, plugin: Optional[QWidget] = None) -> bool:
         """
         显示指定插件
         
         Args:
             plugin_name: 插件名称
+            plugin: 插件实例，调用方已持有时传入可省去查找
             
         Returns:
             是否成功显示
         """
-        if plugin_name not in self._plugins:
-            logger.warning(f"尝试显示不存在的插件: {plugin_name}")
-            return False
+        if plugin is None:
+            plugin_info = self._plugins.get(plugin_name)
+            if plugin_info is None:
+                logger.warning(f"尝试显示不存在的插件: {plugin_name}")
+                return False
+            plugin = plugin_info['widget']
             
         # 如果已经是当前插件，无需切换
         if self._current_plugin == plugin_name:
@@ -194,15 +200,13 @@ class Workspace(QWidget):
                 if hasattr(old_plugin_widget, 'on_deactivate'):
                     old_plugin_widget.on_deactivate()
             
-            # 切换到指定插件
-            plugin_info = self._plugins[plugin_name]
-            self.stacked_widget.setCurrentIndex(plugin_info['index'])
+            # 切换到指定插件（按控件切换，移除其他插件后索引不再准确）
+            self.stacked_widget.setCurrentWidget(plugin)
             
             # 更新标题栏
             self.title_label.setText(plugin_name)
             
             # 检查插件是否有设置界面
-            plugin = plugin_info['widget']
             if hasattr(plugin, 'has_settings') and callable(plugin.has_settings):
                 self.settings_button.setEnabled(plugin.has_settings())
             else: